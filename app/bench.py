@@ -0,0 +1,170 @@
+"""
+Headless batch benchmarking
+
+Runs the same size sweep as the GUI without importing PyQt, e.g.:
+
+    $ python -m app.bench -a bubble-sort -a quick-sort --max-size 500 --seed 1 -o out.csv
+
+Results are written as CSV (one row per algorithm and size) or JSON (columns per
+algorithm), chosen by output file extension.
+"""
+import argparse
+import csv
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from app.models.algorithms import ALGORITHMS, Algorithm
+from app.models.comparison import Comparison
+from app.models.corpus import createCorpus
+from app.models.inputs import PROFILES
+from app.models.measurements import Measurements
+from app.models.sampling import SAMPLINGS
+
+
+def parseArgs(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="python -m app.bench",
+                                     description="Headless sorting algorithms benchmark")
+    parser.add_argument("-a", "--algorithm", action="append", choices=sorted(ALGORITHMS),
+                        help="Algorithm to analyze, may be repeated. All algorithms by default "
+                             "which sort range of bounds, with --corpus all which sort records")
+    parser.add_argument("--lower-bound", type=int, default=1)
+    parser.add_argument("--upper-bound", type=int, default=1000)
+    parser.add_argument("--max-size", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--sampling", choices=SAMPLINGS, default="linear")
+    parser.add_argument("--step", type=int, default=1, help="Step of linear sampling")
+    parser.add_argument("--points", type=int, default=200,
+                        help="Amount of sizes of geometric and adaptive sampling")
+    parser.add_argument("--target-error", type=float, default=None,
+                        help="Repeat every size until relative confidence interval of mean "
+                             "time is below this value, e.g. 0.05")
+    parser.add_argument("--time-budget", type=float, default=1.0,
+                        help="Seconds per size for --target-error")
+    parser.add_argument("--memory-profile", action="store_true",
+                        help="Add peak_memory column, peak bytes allocated by sort "
+                             "(tracemalloc, untimed extra run)")
+    parser.add_argument("--compare", action="store_true",
+                        help="Measure all algorithms on identical inputs in one sweep "
+                             "(single common seed, one input generation per size)")
+    parser.add_argument("--corpus", default="",
+                        help="Sort book records instead of integers: 'synthetic' for generated "
+                             "books or path of .csv/.jsonl book catalog")
+    parser.add_argument("--decorate", action="store_true",
+                        help="Sort precomputed keys of book records and reorder records by them "
+                             "(decorate-sort-undecorate)")
+    parser.add_argument("-p", "--profile", action="append", choices=PROFILES,
+                        help="Input profile, may be repeated to measure every algorithm on "
+                             "each profile. Random by default")
+    parser.add_argument("--swaps", type=int, default=None,
+                        help="Swaps of nearly-sorted profile, 1%% of size by default")
+    parser.add_argument("-o", "--output", type=Path, required=True,
+                        help="Output file, .csv or .json")
+    args = parser.parse_args(argv)
+
+    if args.lower_bound >= args.upper_bound:
+        parser.error("--lower-bound must be less than --upper-bound")
+    if args.swaps is not None and args.swaps < 0:
+        parser.error("--swaps must not be negative")
+    for name in ("max_size", "repeats", "workers", "step", "points"):
+        if getattr(args, name) < 1:
+            parser.error(f"--{name.replace('_', '-')} must be at least 1")
+    if args.compare and args.target_error is not None:
+        parser.error("--compare measures fixed --repeats, it can't be used with --target-error")
+    if args.corpus not in ("", "synthetic") and not Path(args.corpus).is_file():
+        parser.error(f"--corpus file {args.corpus} doesn't exist")
+    integerSorts = [name for name in args.algorithm or () if ALGORITHMS[name].integersOnly]
+    if args.corpus and integerSorts:
+        parser.error(f"{', '.join(integerSorts)} sort only integers, they can't be used "
+                     f"with --corpus")
+    narrowSorts = [name for name in args.algorithm or ()
+                   if not ALGORITHMS[name].fitsRange(args.lower_bound, args.upper_bound)]
+    if narrowSorts:
+        parser.error(f"{', '.join(narrowSorts)} can't sort range of --lower-bound and "
+                     f"--upper-bound, it is too wide")
+    if args.output.suffix not in (".csv", ".json"):
+        parser.error("--output must have .csv or .json extension")
+    return args
+
+
+def writeCsv(path: Path, results: Dict[str, Measurements]) -> None:
+    with path.open("w", newline="") as file:
+        writer = None
+        for name, measurements in results.items():
+            if writer is None:
+                writer = csv.writer(file)
+                writer.writerow(["algorithm", *measurements.keys()])
+            columns = measurements.toDict()
+            for row in zip(*columns.values()):
+                writer.writerow([name, *row])
+
+
+def writeJson(path: Path, results: Dict[str, Measurements]) -> None:
+    with path.open("w") as file:
+        json.dump({name: measurements.toDict() for name, measurements in results.items()}, file)
+
+
+def printReport(name: str, algorithm: Algorithm, data: Measurements) -> None:
+    report = algorithm.fitComplexity(data)
+    if report is None:
+        return
+    print(f"  best fit {report.best} (R^2 = {report.best.r2:.4f}), "
+          f"declared {report.declared} (R^2 = {report.declared.r2:.4f})", file=sys.stderr)
+    if not report.matches:
+        print(f"  WARNING: empirical complexity of {name} does not match declared one",
+              file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parseArgs(argv)
+    names = args.algorithm or [name for name, algorithm in ALGORITHMS.items()
+                               if not (args.corpus and algorithm.integersOnly)
+                               and algorithm.fitsRange(args.lower_bound, args.upper_bound)]
+    profiles = args.profile or ["random"]
+    results = {}
+    corpus = createCorpus(args.corpus, args.seed)
+    if args.compare:
+        comparison = Comparison.create(names, args.lower_bound, args.upper_bound, args.max_size,
+                                       args.repeats, workers=args.workers, seed=args.seed,
+                                       profiles=profiles, swaps=args.swaps,
+                                       sampling=args.sampling, step=args.step,
+                                       points=args.points, memoryProfile=args.memory_profile,
+                                       decorate=args.decorate, corpus=corpus)
+        start = time.perf_counter()
+        results = comparison.calculate()
+        print(f"comparison: {len(comparison.sizes())} sizes in "
+              f"{time.perf_counter() - start:.2f} s", file=sys.stderr)
+        for name, algorithm in comparison.algorithms.items():
+            print(f"{name}:", file=sys.stderr)
+            printReport(name, algorithm, results[name])
+    else:
+        for profile in profiles:
+            for name in names:
+                algorithm = ALGORITHMS[name](args.lower_bound, args.upper_bound, args.max_size,
+                                             args.repeats, workers=args.workers, seed=args.seed,
+                                             sampling=args.sampling, step=args.step,
+                                             points=args.points, targetError=args.target_error,
+                                             timeBudget=args.time_budget,
+                                             memoryProfile=args.memory_profile,
+                                             decorate=args.decorate, corpus=corpus,
+                                             profile=profile, swaps=args.swaps)
+                label = name if len(profiles) == 1 else Comparison.label(name, profile)
+                start = time.perf_counter()
+                results[label] = algorithm.calculate()
+                print(f"{label}: {results[label].rows} sizes in "
+                      f"{time.perf_counter() - start:.2f} s", file=sys.stderr)
+                printReport(label, algorithm, results[label])
+
+    if args.output.suffix == ".csv":
+        writeCsv(args.output, results)
+    else:
+        writeJson(args.output, results)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
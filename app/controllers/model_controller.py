@@ -1,4 +1,4 @@
-from PyQt5.QtCore import QObject, pyqtSlot
+from PyQt5.QtCore import QObject, QTimer, pyqtSlot
 
 from app.models import Model
 from app.views import View
@@ -9,6 +9,11 @@ class ModelController(QObject):
         super().__init__()
         self._model = model
         self._view = view
+        # Decoration changes of one event loop pass are applied to plot at once
+        self._decorationsTimer = QTimer(self)
+        self._decorationsTimer.setSingleShot(True)
+        self._decorationsTimer.setInterval(0)
+        self._decorationsTimer.timeout.connect(self.applyDecorations)
 
         self._model.decorations.lineColorChanged.connect(self.onDecorationsChange)
         self._model.decorations.backgroundColorChanged.connect(self.onDecorationsChange)
@@ -19,6 +24,7 @@ class ModelController(QObject):
         self._model.lowerBoundChanged.connect(self.onLowerBoundChange)
         self._model.upperBoundChanged.connect(self.onUpperBoundChange)
         self._model.algorithmChanged.connect(self.onAlgorithmChange)
+        self._model.workersChanged.connect(self.onWorkersChange)
 
     @pyqtSlot(int)
     def onRepetitionsAmountChange(self, value):
@@ -36,11 +42,19 @@ class ModelController(QObject):
     def onUpperBoundChange(self, value):
         self._view.ui.upperBoundInput.setText(str(value))
 
+    @pyqtSlot(int)
+    def onWorkersChange(self, value):
+        self._view.ui.workersInput.setText(str(value))
+
     @pyqtSlot(str)
     def onAlgorithmChange(self, value):
         self._view.ui.algorithmSelect.setCurrentText(value)
 
     def onDecorationsChange(self):
+        self._decorationsTimer.start()
+
+    @pyqtSlot()
+    def applyDecorations(self):
         self._view.ui.updatePlots(lineColor=self._model.decorations.lineColor,
                                   backgroundColor=self._model.decorations.backgroundColor,
                                   lineWidth=self._model.decorations.lineWidth,
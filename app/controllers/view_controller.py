@@ -1,12 +1,36 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional, Union
+
 from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
 
-from app.models import Model
+from app.models import Algorithm, AnalysisCancelled, Comparison, Measurements, Model
 from app.views import View
 
 
+@dataclass
+class Job:
+    """
+    Analysis job state shared between GUI thread and its worker
+    """
+    id: int
+    key: tuple
+    cancelled: threading.Event = field(default_factory=threading.Event)
+    done: threading.Event = field(default_factory=threading.Event)
+
+
 class ViewController(QObject):
-    tableDataChanged = pyqtSignal(dict)
-    plotDataChanged = pyqtSignal(dict, str)
+    tableRowsAppended = pyqtSignal(int, object)
+    plotRowsAppended = pyqtSignal(int, object)
+    progressChanged = pyqtSignal(int, float, float)
+    analysisFinished = pyqtSignal(int, str)
+    estimateFitted = pyqtSignal(int, object)
+
+    # Streamed rows are batched into one signal per interval, seconds
+    batchInterval = 0.1
+    # Rows of array preview published into table at once
+    previewChunk = 100000
 
     def __init__(self, model: Model, view: View):
         super().__init__()
@@ -14,6 +38,8 @@ class ViewController(QObject):
         self._view = view
         # Add async functionality
         self.threadPool = QThreadPool()
+        self._job: Optional[Job] = None
+        self._jobCount = 0
 
         # listen for model event signals
         # View events
@@ -21,44 +47,191 @@ class ViewController(QObject):
         self._view.ui.maxSizeInput.textChanged.connect(self.changeMaxSize)
         self._view.ui.lowerBoundInput.textChanged.connect(self.changeLowerBound)
         self._view.ui.upperBoundInput.textChanged.connect(self.changeUpperBound)
+        self._view.ui.workersInput.textChanged.connect(self.changeWorkers)
         self._view.ui.algorithmSelect.currentTextChanged.connect(
             lambda: self.changeAlgorithm(self._view.ui.algorithmSelect.currentData())
         )
         self._view.ui.tablePresentationButton.clicked.connect(self.showAsyncTable)
         self._view.ui.plotPresentationButton.clicked.connect(self.showAsyncPlot)
+        self._view.ui.compareTableButton.clicked.connect(self.showAsyncComparisonTable)
+        self._view.ui.comparePlotButton.clicked.connect(self.showAsyncComparisonPlot)
+        self._view.ui.cancelButton.clicked.connect(self.cancelJob)
         self._view.ui.tableBeforeSortButton.clicked.connect(self.arrayBeforeSort)
         self._view.ui.tableAfterSortButton.clicked.connect(self.arrayAfterSort)
         self._view.ui.tableBookBeforeSortButton.clicked.connect(self.booksBeforeSort)
         self._view.ui.tableBookAfterSortButton.clicked.connect(self.booksAfterSort)
 
-        self.tableDataChanged.connect(self.showTable)
-        self.plotDataChanged.connect(self.showPlot)
+        self.tableRowsAppended.connect(self.appendTable)
+        self.plotRowsAppended.connect(self.appendPlot)
+        self.progressChanged.connect(self.showProgress)
+        self.analysisFinished.connect(self.showFinished)
+        self.estimateFitted.connect(self.showEstimate)
 
     def showAsyncTable(self):
+        if not self.fitsRange():
+            return
+        cached = self._model.cachedAnalysis()
+        if cached is not None:
+            self.cancelJob()
+            self.showTable(cached[0])
+            self.showComplexity(cached[0])
+            return
+        job = self.startJob(("table", *self._model.analysisKey()))
+        if job is None:
+            return
+        stream, algorithm = self._model.analyzeStream(job.cancelled.is_set)
+        self.showTable(Measurements())
         self._view.ui.statusbar.showMessage("Status: Obliczenie..")
-        worker = Worker(self.getTableData)
+        worker = Worker(self.streamData, job, stream, algorithm,
+                        self.tableRowsAppended,
+                        f"Info: Tablica danych dla algorytmu {self._model.algorithm}")
         self.threadPool.start(worker)
 
     def showAsyncPlot(self):
+        if not self.fitsRange():
+            return
+        cached = self._model.cachedAnalysis()
+        if cached is not None:
+            self.cancelJob()
+            self.showPlot(*cached)
+            self.showComplexity(cached[0])
+            return
+        job = self.startJob(("plot", *self._model.analysisKey()))
+        if job is None:
+            return
+        stream, algorithm = self._model.analyzeStream(job.cancelled.is_set)
+        self.showPlot(Measurements(), repr(algorithm))
         self._view.ui.statusbar.showMessage("Status: Obliczenie...")
-        worker = Worker(self.getPlotData)
+        worker = Worker(self.streamData, job, stream, algorithm,
+                        self.plotRowsAppended,
+                        f"Info: Wykres dla algorytmu {self._model.algorithm}")
         self.threadPool.start(worker)
 
-    def getTableData(self):
-        data, _ = self._model.analyze()
-        self.tableDataChanged.emit(data)
+    def showAsyncComparisonTable(self):
+        self.startComparison("table", self.tableRowsAppended,
+                             lambda comparison: self.showTable(Measurements()))
+
+    def showAsyncComparisonPlot(self):
+        decorations = self._model.decorations
+        self.startComparison("plot", self.plotRowsAppended,
+                             lambda comparison: self._view.ui.createComparisonPlot(
+                                 Measurements(), comparison.algorithms, repr(comparison),
+                                 lineColor=decorations.lineColor,
+                                 backgroundColor=decorations.backgroundColor,
+                                 lineWidth=decorations.lineWidth,
+                                 lineStyle=decorations.lineStyle))
+
+    def startComparison(self, presentation: str, appended: pyqtSignal,
+                        createView: Callable[[Comparison], None]):
+        """
+        Starts streamed comparison of compared algorithms over identical inputs
+        :param presentation: Kind of presentation, part of job key
+        :param appended: Signal receiving streamed rows
+        :param createView: Creates empty presentation for comparison
+        """
+        names = self._model.comparedAlgorithms
+        if not names:
+            self._view.ui.statusbar.showMessage("Info: Wybierz algorytmy do porównania")
+            return
+        if self._model.corpus and all(self._model.algorithmList[name].integersOnly
+                                      for name in names):
+            self._view.ui.statusbar.showMessage(
+                "Info: Wybrane algorytmy sortują tylko liczby całkowite, nie książki")
+            return
+        if not any(self._model.algorithmList[name].fitsRange(self._model.lowerBound,
+                                                             self._model.upperBound)
+                   for name in names):
+            self._view.ui.statusbar.showMessage(
+                "Info: Zakres wartości jest zbyt szeroki dla wybranych algorytmów")
+            return
+        job = self.startJob(("compare", presentation, *self._model.comparisonKey()))
+        if job is None:
+            return
+        stream, comparison = self._model.compareStream(job.cancelled.is_set)
+        createView(comparison)
+        self._view.ui.statusbar.showMessage("Status: Obliczenie...")
+        worker = Worker(self.streamData, job, stream, comparison, appended,
+                        f"Info: Porównanie algorytmów {', '.join(names)}")
+        self.threadPool.start(worker)
+
+    def fitsRange(self) -> bool:
+        """
+        Refuses analysis of algorithm which can't sort range of values of bounds
+        :return: True when algorithm can sort it
+        """
+        algorithm = self._model.algorithmList[self._model.algorithm]
+        if algorithm.fitsRange(self._model.lowerBound, self._model.upperBound):
+            return True
+        self._view.ui.statusbar.showMessage(
+            f"Info: Zakres wartości jest zbyt szeroki dla algorytmu {self._model.algorithm}, "
+            f"najwyżej {algorithm.maxRange}")
+        return False
+
+    def startJob(self, key: tuple) -> Optional[Job]:
+        """
+        Registers new analysis job. Identical job already in progress is reused (None is
+        returned), any other in-flight job is cancelled and superseded by new one
+        """
+        if self._job is not None and not self._job.done.is_set():
+            if self._job.key == key:
+                self._view.ui.statusbar.showMessage("Info: To samo obliczenie już trwa")
+                return None
+            self._job.cancelled.set()
+        self._jobCount += 1
+        self._job = Job(self._jobCount, key)
+        return self._job
+
+    @pyqtSlot()
+    def cancelJob(self):
+        if self._job is not None and not self._job.done.is_set():
+            self._job.cancelled.set()
+            self._view.ui.statusbar.showMessage("Info: Obliczenie zatrzymane")
 
-    def getPlotData(self):
-        data, title = self._model.analyze()
-        self.plotDataChanged.emit(data, title)
+    def streamData(self, job: Job, stream: Iterator[Dict[str, float]],
+                   algorithm: Union[Algorithm, Comparison], appended: pyqtSignal, message: str):
+        """
+        Runs on worker thread. Collects streamed records and emits them in batches: first
+        record right away, then at most one batch (with progress and ETA) per batchInterval.
+        Completed sweep is fitted to complexity classes, which fills in estimated time
+        """
+        expectedWork, work = algorithm.expectedWork(), 0.0
+        rows, batch, lastEmit, start = [], [], 0.0, time.perf_counter()
+        try:
+            for row in stream:
+                rows.append(row)
+                batch.append(row)
+                work += max(algorithm.analyticalTime(row["size"]), 1)
+                if time.perf_counter() - lastEmit >= self.batchInterval:
+                    appended.emit(job.id, Measurements.fromRows(batch))
+                    done = min(work / expectedWork, 1.0)
+                    elapsed = time.perf_counter() - start
+                    self.progressChanged.emit(job.id, done, elapsed * (1 - done) / done)
+                    batch, lastEmit = [], time.perf_counter()
+        except AnalysisCancelled:
+            return
+        except Exception as error:
+            # E.g. missing or invalid book catalog, or memory exhausted by wide range of values.
+            # Worker reports every failure, so status bar isn't left in calculation
+            self.analysisFinished.emit(job.id, f"Błąd: {str(error) or repr(error)}")
+            return
+        finally:
+            job.done.set()
+        if batch:
+            appended.emit(job.id, Measurements.fromRows(batch))
+        data = algorithm.finalize(rows)
+        self.estimateFitted.emit(job.id, data)
+        report = algorithm.fitComplexity(data)
+        if report is not None:
+            message = f"{message}: {report.describe()}"
+        self.analysisFinished.emit(job.id, message)
 
-    @pyqtSlot(dict)
+    @pyqtSlot(object)
     def showTable(self, data):
-        self._view.ui.createTable(data, len(list(data.values())[0]), len(data))
+        self._view.ui.createTable(data)
         self._view.ui.statusbar.showMessage(
             f"Info: Tablica danych dla algorytmu {self._model.algorithm}")
 
-    @pyqtSlot(dict, str)
+    @pyqtSlot(object, str)
     def showPlot(self, data, title):
         self._view.ui.createPlot(data, title, lineColor=self._model.decorations.lineColor,
                                  backgroundColor=self._model.decorations.backgroundColor,
@@ -67,37 +240,131 @@ class ViewController(QObject):
         self._view.ui.statusbar.showMessage(f"Info: Wykres dla algorytmu"
                                             f" {self._model.algorithm}")
 
+    def isCurrentJob(self, jobId: int) -> bool:
+        return self._job is not None and self._job.id == jobId and \
+            not self._job.cancelled.is_set()
+
+    @pyqtSlot(int, object)
+    def appendTable(self, jobId, data):
+        if self.isCurrentJob(jobId):
+            self._view.ui.appendTable(data)
+
+    @pyqtSlot(int, object)
+    def appendPlot(self, jobId, data):
+        if self.isCurrentJob(jobId):
+            self._view.ui.appendPlot(data)
+
+    @pyqtSlot(int, float, float)
+    def showProgress(self, jobId, done, eta):
+        if self.isCurrentJob(jobId):
+            self._view.ui.statusbar.showMessage(
+                f"Status: Obliczenie... {done:.0%}, pozostało ok. {eta:.0f} s")
+
+    @pyqtSlot(int, str)
+    def showFinished(self, jobId, message):
+        if self.isCurrentJob(jobId):
+            self._view.ui.statusbar.showMessage(message)
+
+    @pyqtSlot(int, object)
+    def showEstimate(self, jobId, data):
+        if self.isCurrentJob(jobId):
+            self._view.ui.updateEstimate(data)
+
+    def showComplexity(self, data):
+        report = self._model.complexityReport(data)
+        if report is not None:
+            self._view.ui.statusbar.showMessage(
+                f"{self._view.ui.statusbar.currentMessage()}: {report.describe()}")
+
     @pyqtSlot()
     def arrayBeforeSort(self):
-        algorithm = self._model.initAlgorithm()
-        data = algorithm.beforeSort()
-        self._view.ui.createTable(data, len(list(data.values())[0]), len(data))
-        self._view.ui.statusbar.showMessage(
-            f"Info: Tablica przed sortowaniem {self._model.algorithm}")
+        self.startPreview(False, False, f"Info: Tablica przed sortowaniem {self._model.algorithm}")
 
     @pyqtSlot()
     def arrayAfterSort(self):
-        algorithm = self._model.initAlgorithm()
-        data = algorithm.afterSort()
-        self._view.ui.createTable(data, len(list(data.values())[0]), len(data))
-        self._view.ui.statusbar.showMessage(
-            f"Info: Tablica po sortowaniu {self._model.algorithm}")
+        self.startPreview(False, True, f"Info: Tablica po sortowaniu {self._model.algorithm}")
 
     @pyqtSlot()
     def booksBeforeSort(self):
-        algorithm = self._model.initAlgorithm()
-        data = algorithm.booksBeforeSort()
-        self._view.ui.createTable(data, len(list(data.values())[0]), len(data))
-        self._view.ui.statusbar.showMessage(
-            f"Info: Tablica przed sortowaniem {self._model.algorithm}")
+        self.startPreview(True, False, f"Info: Tablica przed sortowaniem {self._model.algorithm}")
 
     @pyqtSlot()
     def booksAfterSort(self):
+        self.startPreview(True, True, f"Info: Tablica po sortowaniu {self._model.algorithm}")
+
+    def startPreview(self, books: bool, sort: bool, message: str):
+        """
+        Starts background job showing generated (and sorted) array or books
+        """
+        if not self.fitsRange():
+            return
+        job = self.startJob(("preview", books, sort, *self._model.analysisKey()))
+        if job is None:
+            return
         algorithm = self._model.initAlgorithm()
-        data = algorithm.booksAfterSort()
-        self._view.ui.createTable(data, len(list(data.values())[0]), len(data))
-        self._view.ui.statusbar.showMessage(
-            f"Info: Tablica po sortowaniu {self._model.algorithm}")
+        self.showTable({})
+        self._view.ui.statusbar.showMessage("Status: Obliczenie...")
+        worker = Worker(self.streamPreview, job, algorithm, books, sort, message)
+        self.threadPool.start(worker)
+
+    def streamPreview(self, job: Job, algorithm: Algorithm, books: bool, sort: bool,
+                      message: str):
+        """
+        Runs on worker thread. Generates preview data, sorts it and publishes it into table
+        in chunks of previewChunk rows. Sort which takes longer than one batchInterval runs
+        in child process, reports progress estimated from analytical time and is terminated
+        when job is cancelled
+        """
+        try:
+            if books:
+                items = algorithm.generateBooks()
+                if sort:
+                    items = self.sortPreview(job, algorithm, items, records=True)
+                data = algorithm.formatBooksArray(items)
+            else:
+                items = algorithm.generateArray()
+                if sort:
+                    items = self.sortPreview(job, algorithm, items)
+                data = algorithm.formatArrays(items)
+
+            rows = len(next(iter(data.values()), ()))
+            for first in range(0, rows, self.previewChunk):
+                if job.cancelled.is_set():
+                    return
+                self.tableRowsAppended.emit(job.id, {
+                    key: values[first:first + self.previewChunk] for key, values in data.items()
+                })
+                self.progressChanged.emit(job.id, min(first + self.previewChunk, rows) / rows, 0)
+        except AnalysisCancelled:
+            return
+        except RuntimeError as error:
+            message = f"Błąd: Sortowanie nie powiodło się ({error})"
+        except Exception as error:
+            # E.g. MemoryError of counting sort, which has no message of its own
+            message = f"Błąd: {str(error) or repr(error)}"
+        finally:
+            job.done.set()
+        self.analysisFinished.emit(job.id, message)
+
+    def sortPreview(self, job: Job, algorithm: Algorithm, array: list,
+                    records: bool = False) -> list:
+        expected = algorithm.estimateSortTime(len(array), records=records)
+        if expected < self.batchInterval:
+            if records:
+                algorithm.sortRecords(array)
+            else:
+                algorithm.sort(array)
+            return array
+
+        start = time.perf_counter()
+
+        def showProgress():
+            elapsed = time.perf_counter() - start
+            self.progressChanged.emit(job.id, min(elapsed / expected, 0.99),
+                                      max(expected - elapsed, 0))
+
+        return algorithm.sortCancellable(array, job.cancelled.is_set, showProgress,
+                                         self.batchInterval, records)
 
     @pyqtSlot(str)
     def changeRepetitionsAmount(self, value):
@@ -157,6 +424,17 @@ class ViewController(QObject):
             self._view.ui.upperBoundInput.setStyleSheet(
                 "background-color: #FF4949; border-radius: 5px;")
 
+    @pyqtSlot(str)
+    def changeWorkers(self, value):
+        if self.defaultParse(value):
+            self._model.workers = int(value)
+            self._view.ui.workersInput.setStyleSheet(
+                "background-color: #ffffff; color: #000000; border-radius: 5px;"
+            )
+        else:
+            self._view.ui.workersInput.setStyleSheet(
+                "background-color: #FF4949; border-radius: 5px;")
+
     @pyqtSlot(str)
     def changeAlgorithm(self, value):
         if not isinstance(value, str):
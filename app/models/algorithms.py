@@ -1,76 +1,190 @@
-import functools
+import dataclasses
 import itertools
 import math
+import multiprocessing
+import os
 import random
 import time
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from datetime import datetime
-from statistics import StatisticsError, mean
-from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from statistics import NormalDist, mean, pstdev, stdev
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
+import numpy
 
+from .books import BOOKS, PREFIX_LENGTH, Book, prefixCodes, undecorate
+from .complexity import ComplexityReport, fitComplexity
+from .corpus import Corpus
+from .harness import Harness
+from .inputs import InputGenerator
+from .measurements import Measurements
+from .samples import Sample, SampleStore
+from .sampling import geometricSizes, linearSizes, refineSizes
 
-def timer(func: Callable) -> Callable:
+
+class AnalysisCancelled(Exception):
     """
-    Timer decorator which measures time execution and returns cycles count from function
-    :param func: Basically, sort function
-    :return: return function wrapper, which return time and memory
+    Raised inside sweep when its job was cancelled
     """
 
-    @functools.wraps(func)
-    def wrapper(*args, **kwargs):
-        start = time.perf_counter()
-        memory = func(*args, **kwargs)
-        end = time.perf_counter()
-        period = end - start
-        return period, memory
-
-    return wrapper
-
 
-@dataclass
-class Book:
-    signature: str
-    title: str
-    author: str
-    publish_date: datetime.date
+def confidenceError(samples: List[float], confidence: float = 0.95) -> float:
+    """
+    Relative half-width of confidence interval of samples mean, using Student's t quantile
+    (Cornish-Fisher expansion of normal quantile, accurate enough from 3 samples on)
+    :param samples: Measured values
+    :param confidence: Confidence level
+    :return: Half-width divided by mean, infinity when it can't be estimated
+    """
+    n = len(samples)
+    average = mean(samples) if n else 0
+    if n < 2 or average == 0:
+        return math.inf
+    z = NormalDist().inv_cdf((1 + confidence) / 2)
+    v = n - 1
+    t = z + (z ** 3 + z) / (4 * v) + (5 * z ** 5 + 16 * z ** 3 + 3 * z) / (96 * v ** 2)
+    return t * stdev(samples) / math.sqrt(n) / abs(average)
 
-    def __gt__(self, book):
-        return self.title.lower() > book.title.lower()
 
-    def __lt__(self, other):
-        return self.title.lower() < other.title.lower()
+def _initWorker(counter) -> None:
+    """
+    Process pool initializer. Pins every worker to its own CPU core (where the platform
+    allows it) so that concurrent work units don't migrate and disturb each other's timings
+    :param counter: Shared counter used to hand out core numbers
+    """
+    if hasattr(os, "sched_setaffinity"):
+        cores = sorted(os.sched_getaffinity(0))
+        with counter.get_lock():
+            index = counter.value
+            counter.value += 1
+        os.sched_setaffinity(0, {cores[index % len(cores)]})
 
-    def __le__(self, other):
-        return self.title.lower() <= other.title.lower()
 
-    def __eq__(self, other):
-        return self.title.lower() == other.title.lower()
+def _measureUnit(unit: Tuple[Any, int, int]) -> Any:
+    """
+    Runs single (size, repeat) work unit inside pool worker
+    :param unit: Algorithm (or Comparison) instance, size of array and repeat number
+    :return: Result of its "measure", e.g. Sample of one sort
+    """
+    subject, size, repeat = unit
+    return subject.measure(size, repeat)
 
-    def __ne__(self, other):
-        return self.title.lower() != other.title.lower()
 
-    def __ge__(self, other):
-        return self.title.lower() >= other.title.lower()
+def _sortInChild(algorithm: "Algorithm", array: list, records: bool, connection) -> None:
+    """
+    Target of child process of cancellable sort, sends sorted array back
+    """
+    if records:
+        algorithm.sortRecords(array)
+    else:
+        algorithm.sort(array)
+    connection.send(array)
+    connection.close()
 
-    def __str__(self):
-        return str(self.title)
 
-    def __truediv__(self, other):
-        return len(self.title) / other
+def parallelUnits(subject: Any, units: Iterator[Tuple[int, int]], workers: int) -> Iterator[Any]:
+    """
+    Spreads (size, repeat) work units over process pool and yields results in order.
+    Units are submitted one at a time with only a few queued ahead per worker, so every
+    worker sorts exactly one array at once and closing doesn't wait for the rest of sweep
+    :param subject: Picklable object whose "measure(size, repeat)" runs in workers
+    :param units: Work units
+    :param workers: Amount of worker processes
+    :return: Iterator of results of units
+    """
+    pending = deque()
+    counter = multiprocessing.Value("i", 0)
+    with ProcessPoolExecutor(max_workers=workers, initializer=_initWorker,
+                             initargs=(counter,)) as executor:
+        def submit(amount: int) -> None:
+            for size, repeat in itertools.islice(units, amount):
+                pending.append(executor.submit(_measureUnit, (subject, size, repeat)))
+
+        try:
+            submit(2 * workers)
+            while pending:
+                result = pending.popleft().result()
+                submit(1)
+                yield result
+        finally:
+            for future in pending:
+                future.cancel()
 
 
 class Algorithm(ABC):
     """
     Abstract algorithm class
     """
-
-    def __init__(self, lowerBound: int, upperBound: int, maxSize: int, repeats: int) -> None:
+    # Upper limit of repetitions of one size in adaptive measurement mode
+    maxRepeats = 1000
+    # Declared average complexity class, key of COMPLEXITIES, e.g. "n^2"
+    complexity: str
+    # Algorithm relies on integer values, it can't sort records of corpus
+    integersOnly = False
+    # Widest range of values (upperBound - lowerBound) algorithm can sort, None when unlimited
+    maxRange: Optional[int] = None
+
+    def __init__(self, lowerBound: int, upperBound: int, maxSize: int, repeats: int,
+                 workers: int = 1, seed: Optional[int] = None, sampling: str = "linear",
+                 step: int = 1, points: int = 200, targetError: Optional[float] = None,
+                 timeBudget: float = 1.0, harness: Optional[Harness] = None,
+                 memoryProfile: bool = False, decorate: bool = False,
+                 corpus: Optional[Corpus] = None, profile: str = "random",
+                 swaps: Optional[int] = None) -> None:
         self.maxSize = maxSize
         self.lowerBound = lowerBound
         self.upperBound = upperBound
         self.repeats = repeats
+        self.workers = workers
+        self.seed = seed
+        self.sampling = sampling
+        self.step = step
+        self.points = points
+        self.targetError = targetError
+        self.timeBudget = timeBudget
+        self.harness = harness if harness is not None else Harness()
+        self.memoryProfile = memoryProfile
+        self.decorate = decorate
+        self.corpus = corpus
+        self.profile = profile
+        self.swaps = swaps
+        self.inputs = InputGenerator(lowerBound, upperBound, seed, profile, swaps)
+        if not self.fitsRange(lowerBound, upperBound):
+            raise ValueError(f"{self!r} sorts values of range at most {self.maxRange} wide, "
+                             f"[{lowerBound}, {upperBound}) is wider")
+
+    @classmethod
+    def fitsRange(cls, lowerBound: int, upperBound: int) -> bool:
+        """
+        Whether algorithm can sort values in [lowerBound, upperBound)
+        """
+        return cls.maxRange is None or upperBound - lowerBound <= cls.maxRange
+
+    def parameters(self) -> Dict[str, Any]:
+        """
+        Parameters which define result of analysis, e.g. for caching.
+        Execution details, like amount of workers, don't belong here
+        """
+        return {
+            "lowerBound": self.lowerBound,
+            "upperBound": self.upperBound,
+            "maxSize": self.maxSize,
+            "repeats": self.repeats,
+            "seed": self.seed,
+            "profile": self.profile if self.corpus is None else None,
+            "swaps": self.swaps if self.profile == "nearly-sorted" else None,
+            "sampling": self.sampling,
+            "step": self.step if self.sampling == "linear" else None,
+            "points": self.points if self.sampling != "linear" else None,
+            "targetError": self.targetError,
+            "timeBudget": self.timeBudget if self.targetError else None,
+            "harness": dataclasses.asdict(self.harness),
+            "memoryProfile": self.memoryProfile,
+            "corpus": self.corpus.parameters() if self.corpus is not None else None,
+            "decorate": self.decorate if self.corpus is not None else None,
+        }
 
     def generateArray(self, size: Optional[int] = None) -> List[int]:
         """
@@ -78,46 +192,49 @@ class Algorithm(ABC):
         :param size: Size of array
         :return: list of random integers
         """
-        if size is None:
-            return [random.randrange(self.lowerBound, self.upperBound) for _ in range(self.maxSize)]
-        else:
-            return [random.randrange(self.lowerBound, self.upperBound) for _ in range(size)]
-
-    def generateBooks(self):
-        books = [
-            Book(title="Król", author="Szczepan Twardoch", signature="9788308070956",
-                 publish_date=datetime.strptime('2020-10-28', "%Y-%m-%d")),
-            Book(title="Opowieść podręcznej", author="Margaret Atwood", signature="9788380324398",
-                 publish_date=datetime.strptime('2020-02-26', "%Y-%m-%d")),
-            Book(title="27 śmierci Toby’ego Obeda", author="Joanna Gierak-Onoszko",
-                 signature="9788365970343",
-                 publish_date=datetime.strptime('2019-05-22', "%Y-%m-%d")),
-            Book(title="Gdzie śpiewają raki", author="Delia Owens", signature="9788381392686",
-                 publish_date=datetime.strptime('2019-10-30', "%Y-%m-%d")),
-            Book(title="Siedem sióstr", author="Lucinda Riley", signature="9788381257947",
-                 publish_date=datetime.strptime('2019-11-13', "%Y-%m-%d"))
-        ]
-
-        return books
-
-    def formatMeasurements(self, period: float, size: int, memory: int) -> Dict[str, str]:
-        """
-        Format all measurements into dict
-        :param period: Time delta of algorithm execution
+        return self.inputs.block(self.maxSize if size is None else size, 1)[0].tolist()
+
+    def generateBooks(self, size: Optional[int] = None) -> List[Book]:
+        """
+        Generate max sized or given sized list of books of corpus, or sample books
+        when there is no corpus
+        :param size: Amount of books
+        :return: List of books
+        """
+        if self.corpus is None:
+            return list(BOOKS)
+        return self.corpus.array(self.maxSize if size is None else size)
+
+    def record(self, period: float, size: int, comparisons: float, moves: float, repeats: int,
+               error: float, peakMemory: Optional[float] = None) -> Dict[str, float]:
+        """
+        Collect all measurements of one size into record
+        :param period: Time delta of algorithm execution, seconds
         :param size: Size of array
-        :param memory: Amount of cycles executed
-        :return: Dict of measurements
+        :param comparisons: Amount of comparisons of elements
+        :param moves: Amount of element writes
+        :param repeats: Amount of repetitions used
+        :param error: Relative half-width of 95% confidence interval of time
+        :param peakMemory: Peak allocated bytes, only in memory profiling mode
+        :return: Dict of measurements, time in microseconds. Estimated time is known only
+                 after fitting of whole sweep, so it is NaN
         """
-        return {
-            "size": f"{size}",
-            "calculated_time": f"{period * 1000000:.2f}",
-            "estimated_time": f"{self.analyticalTime(size):.2f}",
-            "memory": f"{memory:.2f}"
+        record = {
+            "size": size,
+            "calculated_time": period * 1000000,
+            "estimated_time": math.nan,
+            "comparisons": comparisons,
+            "moves": moves,
         }
+        if peakMemory is not None:
+            record["peak_memory"] = peakMemory
+        record.update(repeats=repeats, error=error)
+        return record
 
-    def formatArrays(self, array: List[int]) -> Dict[str, List[str]]:
+    def formatArrays(self, array: List[int]) -> Dict[str, List[int]]:
+        # Values are turned into text by table, only for visible rows
         return {
-            "value": [str(i) for i in array]
+            "value": array
         }
 
     def formatBooksArray(self, array: List[Book]) -> Dict[str, List[str]]:
@@ -134,9 +251,43 @@ class Algorithm(ABC):
 
     def booksAfterSort(self):
         books = self.generateBooks()
-        self.sort(books)
+        self.sortRecords(books)
         return self.formatBooksArray(books)
 
+    def sortRecords(self, records: List[Book]) -> None:
+        """
+        Sorts records in place. In decorate-sort-undecorate mode algorithm sorts list of
+        their precomputed keys instead, so it compares plain strings without calling
+        comparison methods of records, and records are put in order of sorted keys
+        :param records: Records to sort
+        :raises ValueError: When algorithm sorts only integers
+        """
+        self._checkRecords()
+        if not self.decorate:
+            self.sort(records)
+            return
+        keys = [record.key for record in records]
+        self.sort(keys)
+        records[:] = undecorate(records, keys)
+
+    def countedSortRecords(self, records: List[Book]) -> Tuple[int, int]:
+        """
+        Counting twin of "sortRecords", counts operations of sort of records or their keys
+        :param records: Records to sort
+        :return: Amount of comparisons of elements and amount of element writes into arrays
+        """
+        self._checkRecords()
+        if not self.decorate:
+            return self.countedSort(records)
+        keys = [record.key for record in records]
+        counts = self.countedSort(keys)
+        records[:] = undecorate(records, keys)
+        return counts
+
+    def _checkRecords(self) -> None:
+        if self.integersOnly:
+            raise ValueError(f"{self!r} sorts only integers, it can't sort books")
+
     def beforeSort(self):
         array = self.generateArray(self.maxSize)
         return self.formatArrays(array)
@@ -146,41 +297,299 @@ class Algorithm(ABC):
         self.sort(array)
         return self.formatArrays(array)
 
-    def calculate(self) -> Dict[str, List[str]]:
+    def estimateSortTime(self, size: int, sampleSize: int = 500, records: bool = False) -> float:
+        """
+        Expected time of one sort of given size: time of sort of smaller sample,
+        scaled by analytical time
+        :param size: Size of array
+        :param sampleSize: Maximum size of timed sample
+        :param records: Estimate sort of books instead of integers
+        :return: Seconds
+        """
+        sample = min(size, sampleSize)
+        if sample < 2:
+            return 0.0
+        if records:
+            period = self.harness.measure(self.sortRecords, self.generateBooks(sample))
+        else:
+            period = self.harness.measure(self.sort, self.generateArray(sample))
+        return period * max(self.analyticalTime(size), 1) / max(self.analyticalTime(sample), 1)
+
+    def sortCancellable(self, array: list, isCancelled: Callable[[], bool],
+                        onWait: Optional[Callable[[], None]] = None,
+                        interval: float = 0.1, records: bool = False) -> list:
+        """
+        Sorts array in child process, so that sort of any length can be stopped at once
+        :param array: Array to sort, left untouched
+        :param isCancelled: Polled every interval, child is terminated when returns True
+        :param onWait: Called every interval while sort runs, e.g. to report progress
+        :param interval: Polling interval, seconds
+        :param records: Array holds books, sorted by "sortRecords"
+        :return: Sorted array
+        :raises AnalysisCancelled: When sort was cancelled
+        :raises RuntimeError: When sorting process failed
+        """
+        context = multiprocessing.get_context()
+        receiver, sender = context.Pipe(duplex=False)
+        process = context.Process(target=_sortInChild, args=(self, array, records, sender),
+                                  daemon=True)
+        process.start()
+        sender.close()
+        try:
+            while not receiver.poll(interval):
+                if isCancelled():
+                    raise AnalysisCancelled()
+                if onWait is not None:
+                    onWait()
+            return receiver.recv()
+        except EOFError:
+            # Child closed pipe without result, e.g. it crashed
+            process.join()
+            raise RuntimeError(f"Sorting process exited with code {process.exitcode}")
+        finally:
+            if process.is_alive():
+                process.terminate()
+            process.join()
+            receiver.close()
+
+    def input(self, size: int, repeat: int = 0) -> list:
+        """
+        Input of work unit, row "repeat" of input block (or books of corpus), so it depends
+        only on (seed, size, repeat) and serial and parallel sweeps sort the same arrays
+        :param size: Size of array
+        :param repeat: Number of repetition
+        :return: New list
+        """
+        # Repetitions over "repeats" (adaptive mode) come from blocks of its multiple size
+        repeats = max(self.repeats, 1) * (repeat // max(self.repeats, 1) + 1)
+        inputs = self.inputs if self.corpus is None else self.corpus
+        return inputs.array(size, repeat, repeats)
+
+    def measure(self, size: int, repeat: int = 0, array: Optional[list] = None) -> Sample:
+        """
+        Single work unit: one sample of given size, measured by harness. Sorts too short
+        to be timed alone are timed on batch of copies of input. Harness times
+        uninstrumented "sort", operations are counted by "countedSort" of copy of input
+        outside of timed region. In memory profiling mode input is sorted once more to trace
+        its peak allocation. With corpus inputs are its books, sorted by "sortRecords"
+        :param size: Size of array
+        :param repeat: Number of repetition
+        :param array: Input of unit, left untouched, made by "input" when None
+        :return: Time of one sort in seconds, its operations and peak allocated bytes
+        """
+        if self.corpus is None:
+            sort, countedSort = self.sort, self.countedSort
+        else:
+            sort, countedSort = self.sortRecords, self.countedSortRecords
+        if array is None:
+            array = self.input(size, repeat)
+        comparisons, moves = countedSort(list(array))
+        peakMemory = 0
+        if self.memoryProfile:
+            peakMemory = self.harness.peakMemory(sort, list(array))
+        return Sample(self.harness.measure(sort, array), comparisons, moves, peakMemory)
+
+    def sizes(self) -> List[int]:
+        """
+        Sizes of arrays measured by sweep. For adaptive sampling it's initial coarse grid,
+        more sizes are chosen during sweep
+        """
+        if self.sampling == "linear":
+            return linearSizes(self.maxSize, self.step)
+        if self.sampling == "geometric":
+            return geometricSizes(self.maxSize, self.points)
+        if self.sampling == "adaptive":
+            return geometricSizes(self.maxSize, max(self.points // 4, 8))
+        raise ValueError(f"Unknown sampling '{self.sampling}'")
+
+    def expectedWork(self) -> float:
+        """
+        Expected work of sweep, sum of analytical time of its sizes. Used for progress,
+        so progress of O(n^2) sweeps isn't overestimated by small sizes
+        """
+        sizes = self.sizes()
+        if self.sampling == "adaptive":
+            sizes = geometricSizes(self.maxSize, self.points)
+        return sum(max(self.analyticalTime(size), 1) for size in sizes)
+
+    def samples(self, isCancelled: Optional[Callable[[], bool]] = None,
+                store: Optional[SampleStore] = None) -> Iterator[Tuple[int, List[Sample]]]:
+        """
+        Measures every size chosen by sampling strategy, repeating each size "repeats" times.
+        Samples already present in store are reused, so only new sizes and extra repetitions
+        are measured, store is extended with them
+        :param isCancelled: Checked between sizes and repeats, stops sweep when returns True
+        :param store: Samples of previous sweeps with same configuration
+        :return: Iterator of size with its samples. Sizes of adaptive sweep come in rounds,
+                 so they aren't ordered
+        :raises AnalysisCancelled: When sweep was cancelled
+        """
+        isCancelled = isCancelled or (lambda: False)
+        store = store if store is not None else SampleStore()
+        if self.sampling != "adaptive":
+            yield from self._measureSizes(self.sizes(), isCancelled, store)
+            return
+
+        measured = {}
+        sizes = self.sizes()
+        while sizes:
+            for size, sampleArr in self._measureSizes(sizes, isCancelled, store):
+                periodArr = [sample.period for sample in sampleArr]
+                measured[size] = (mean(periodArr), pstdev(periodArr))
+                yield size, sampleArr
+            known = sorted(measured)
+            sizes = refineSizes(known, [measured[size][0] for size in known],
+                                [measured[size][1] for size in known],
+                                self.points - len(measured))
+
+    def _measureSizes(self, sizes: List[int], isCancelled: Callable[[], bool],
+                      store: SampleStore) -> Iterator[Tuple[int, List[Sample]]]:
+        if self.targetError:
+            yield from self._measureUntilConfident(sizes, isCancelled, store)
+            return
+
+        plan = [(size, store.get(size, self.repeats)) for size in sizes]
+        units = ((size, repeat) for size, sampleArr in plan
+                 for repeat in range(len(sampleArr), self.repeats))
+        results = self._parallelUnits(units) if self.workers > 1 else self._serialUnits(units)
+
+        try:
+            for size, sampleArr in plan:
+                known = len(sampleArr)
+                for _ in range(known, self.repeats):
+                    if isCancelled():
+                        raise AnalysisCancelled()
+                    sampleArr.append(next(results))
+                if known < self.repeats:
+                    store.extend(size, known, sampleArr[known:])
+                yield size, sampleArr
+        finally:
+            results.close()
+
+    def _measureUntilConfident(self, sizes: List[int], isCancelled: Callable[[], bool],
+                               store: SampleStore) -> Iterator[Tuple[int, List[Sample]]]:
+        """
+        Adaptive measurement mode. Every size is repeated at least "repeats" times and then
+        until relative confidence interval of mean time reaches targetError, time budget of
+        size runs out or maxRepeats is reached. Pool gets one batch of units per worker at once
+        """
+        batch = self.workers if self.workers > 1 else 1
+        with self._unitRunner() as run:
+            for size in sizes:
+                sampleArr = store.get(size, self.maxRepeats)
+                known, start = len(sampleArr), time.perf_counter()
+                while len(sampleArr) < self.maxRepeats and (
+                        len(sampleArr) < max(self.repeats, 2) or
+                        (confidenceError([sample.period for sample in sampleArr]) >
+                         self.targetError and time.perf_counter() - start < self.timeBudget)):
+                    if isCancelled():
+                        raise AnalysisCancelled()
+                    first = len(sampleArr)
+                    units = [(size, repeat) for repeat in
+                             range(first, min(first + batch, self.maxRepeats))]
+                    sampleArr.extend(run(units))
+                if known < len(sampleArr):
+                    store.extend(size, known, sampleArr[known:])
+                yield size, sampleArr
+
+    @contextmanager
+    def _unitRunner(self) -> Iterator[Callable[[List[Tuple[int, int]]], List[Sample]]]:
+        """
+        Function measuring list of (size, repeat) units, in process pool when there are workers
+        """
+        if self.workers <= 1:
+            yield lambda units: [self.measure(size, repeat) for size, repeat in units]
+            return
+
+        counter = multiprocessing.Value("i", 0)
+        with ProcessPoolExecutor(max_workers=self.workers, initializer=_initWorker,
+                                 initargs=(counter,)) as executor:
+            def run(units: List[Tuple[int, int]]) -> List[Sample]:
+                futures = [executor.submit(_measureUnit, (self, size, repeat))
+                           for size, repeat in units]
+                try:
+                    return [future.result() for future in futures]
+                finally:
+                    for future in futures:
+                        future.cancel()
+
+            yield run
+
+    def _serialUnits(self, units: Iterator[Tuple[int, int]]) -> Iterator[Sample]:
+        for size, repeat in units:
+            yield self.measure(size, repeat)
+
+    def _parallelUnits(self, units: Iterator[Tuple[int, int]]) -> Iterator[Sample]:
+        return parallelUnits(self, units, self.workers)
+
+    def iterCalculate(self, isCancelled: Optional[Callable[[], bool]] = None,
+                      store: Optional[SampleStore] = None) -> Iterator[Dict[str, float]]:
+        """
+        Streaming version of calculate, yields aggregated record as soon as size is measured
+        :param isCancelled: Checked between sizes and repeats, stops sweep when returns True
+        :param store: Samples of previous sweeps with same configuration
+        :return: Iterator of records
+        :raises AnalysisCancelled: When sweep was cancelled
+        """
+        for size, sampleArr in self.samples(isCancelled, store):
+            yield self.aggregate(size, sampleArr)
+
+    def aggregate(self, size: int, sampleArr: List[Sample]) -> Dict[str, float]:
+        """
+        Record of size from its samples
+        """
+        periodArr = [sample.period for sample in sampleArr]
+        peakMemory = None
+        if self.memoryProfile:
+            peakMemory = mean(sample.peakMemory for sample in sampleArr)
+        return self.record(mean(periodArr), size,
+                           mean(sample.comparisons for sample in sampleArr),
+                           mean(sample.moves for sample in sampleArr),
+                           len(periodArr), confidenceError(periodArr), peakMemory)
+
+    def calculate(self, store: Optional[SampleStore] = None) -> Measurements:
         """
         Calculates from 1 to MaxSize records for more accuracy
-        :return: Dict of calculated records
+        :param store: Samples of previous sweeps with same configuration
+        :return: Columnar measurements ordered by size
         """
-        data = {
-            "size": [],
-            "calculated_time": [],
-            "estimated_time": [],
-            "memory": []
-        }
-        for size in range(1, self.maxSize):
-            # Iterates for every size and creates records
-            periodArr, memoryArr = [], []
-            for repeat in range(0, self.repeats):
-                array = self.generateArray(size)
-                per, mem = self.sort(array)
-                periodArr.append(per)
-                memoryArr.append(mem)
-            try:
-                period, memory = mean(periodArr), mean(memoryArr)
-            except StatisticsError:
-                period, memory = periodArr[0], memoryArr[0]
-
-            for key, value in self.formatMeasurements(period, size, memory).items():
-                data[key].append(value)
-
-        return data
+        return self.finalize(self.iterCalculate(store=store))
+
+    def finalize(self, rows: Iterable[Dict[str, float]]) -> Measurements:
+        """
+        Turns streamed records into measurements ordered by size, with estimated time
+        of declared complexity fitted to measured time
+        """
+        data = Measurements.fromRows(rows).sortedBy("size")
+        report = self.fitComplexity(data)
+        if report is None:
+            return data
+        return data.withColumn("estimated_time", report.declared.estimate(data["size"]))
+
+    def fitComplexity(self, data: Measurements) -> Optional[ComplexityReport]:
+        """
+        Fits measured time to every candidate complexity class
+        :param data: Measurements of sweep
+        :return: Report, None when sweep has too few sizes
+        """
+        return fitComplexity(data["size"], data["calculated_time"], self.complexity)
 
     @abstractmethod
-    def sort(self, array: List[Union[int, Book]]) -> int:
+    def sort(self, array: List[Union[int, Book]]) -> None:
         """
         Implement sorting algorithm, which mutating and sorting array.
+        Timed variant, must not do any bookkeeping besides sorting
         :param array: List of random integers
-        :return: Amount of cycles counted
+        """
+        pass
+
+    @abstractmethod
+    def countedSort(self, array: List[Union[int, Book]]) -> Tuple[int, int]:
+        """
+        Implement same sorting algorithm as "sort", which also counts its operations.
+        Never timed
+        :param array: List of random integers
+        :return: Amount of comparisons of elements and amount of element writes into arrays
         """
         pass
 
@@ -213,19 +622,31 @@ class BubbleSort(Algorithm):
     Best case: O(n) or O(1)
     """
 
-    @timer
+    complexity = "n^2"
+
     def sort(self, array):
         has_swapped = True
-        count = 0
 
         while has_swapped:
             has_swapped = False
             for i in range(len(array) - 1):
-                count += 1
                 if array[i] > array[i + 1]:
                     array[i], array[i + 1] = array[i + 1], array[i]
                     has_swapped = True
-        return count
+
+    def countedSort(self, array):
+        has_swapped = True
+        comparisons = moves = 0
+
+        while has_swapped:
+            has_swapped = False
+            for i in range(len(array) - 1):
+                comparisons += 1
+                if array[i] > array[i + 1]:
+                    array[i], array[i + 1] = array[i + 1], array[i]
+                    moves += 2
+                    has_swapped = True
+        return comparisons, moves
 
     def analyticalTime(self, n):
         return n ** 2
@@ -248,36 +669,58 @@ class InsertionSort(Algorithm):
     Best case: O(n) or O(1)
     """
 
-    @timer
+    complexity = "n^2"
+
     def sort(self, array):
-        count = self._insertionSort(array)
-        return count
+        self._insertionSort(array)
+
+    def countedSort(self, array):
+        return self._countedInsertionSort(array)
 
     def analyticalTime(self, n):
         return n ** 2
 
-    def _insertionSort(self, array: List[int]) -> int:
+    def _insertionSort(self, array: List[int]) -> None:
         """
         Implementation of "sort" method, instead of implementing directly in abstract
         class, for make it possible to Inherit as a parent for Bucket Sort,
         which use Insertion algorithm
 
         :param array: Array of random integers
-        :return: Amount of cycles executed
         """
-        count = 0
         for index in range(1, len(array)):
-            count += 1
             currentValue = array[index]
             currentIndex = index
 
             while currentIndex > 0 and array[currentIndex - 1] > currentValue:
                 array[currentIndex] = array[currentIndex - 1]
                 currentIndex -= 1
-                count += 1
 
             array[currentIndex] = currentValue
-        return count
+
+    def _countedInsertionSort(self, array: List[int]) -> Tuple[int, int]:
+        """
+        Counting twin of "_insertionSort"
+
+        :param array: Array of random integers
+        :return: Amount of comparisons and element writes
+        """
+        comparisons = moves = 0
+        for index in range(1, len(array)):
+            currentValue = array[index]
+            currentIndex = index
+
+            while currentIndex > 0:
+                comparisons += 1
+                if not array[currentIndex - 1] > currentValue:
+                    break
+                array[currentIndex] = array[currentIndex - 1]
+                currentIndex -= 1
+                moves += 1
+
+            array[currentIndex] = currentValue
+            moves += 1
+        return comparisons, moves
 
     def __repr__(self):
         return "Sortowanie wstaweniem (Insertion sort)"
@@ -294,39 +737,135 @@ class BucketSort(InsertionSort):
     Each bucket is then sorted individually, either using a different sorting algorithm,
     or by recursively applying the bucket sorting algorithm
 
+    Buckets split range between minimum and maximum of values evenly, so inputs narrower
+    than bounds of generator or far from zero are spread over all buckets. Bucket of every
+    element is computed by numpy at once, bucket sizes (bincount and cumsum) give their bounds
+    in single output list, into which elements are placed by counting, in original order.
+    Buckets larger than maxBucket are distributed again over their own range, smaller ones
+    with more than one element are sorted by inner algorithm. Records and strings are
+    distributed by prefixCodes, integers of first characters of their keys, unless other key
+    is given. Bucket of keys with equal prefix is distributed by following characters, like
+    in MSD radix sort
+
     Worst case: O(n^2)
     Average case: O(n + n^2 / k + k) where k is number of buckets
                   O(n) if n ~= k
     """
 
-    @timer
-    def sort(self, array):
-        if isinstance(max(array), Book):
-            maxValue = max(len(book.title) for book in array)
-        else:
-            maxValue = max(array)
-        size = maxValue / len(array)
-        count = 0
-
-        buckets = []
-        for _ in array:
-            buckets.append([])
-            count += 1
-
-        for index in range(len(array)):
-            el = int(array[index] / size)
-            count += 1
-            if el != len(array):
-                buckets[el].append(array[index])
-            else:
-                buckets[len(array) - 1].append(array[index])
-
-        for index in range(len(array)):
-            count += self._insertionSort(buckets[index]) + 1
-
-        array.clear()
-        array.extend(itertools.chain(*buckets))
-        return count
+    complexity = "n"
+    # Amount of buckets, as many as elements when None
+    buckets: Optional[int] = None
+    # Key of ALGORITHMS which sorts every bucket
+    innerSort = "insertion-sort"
+    # Buckets with more elements are distributed again, None sorts every bucket by innerSort
+    maxBucket: Optional[int] = 32
+
+    def parameters(self) -> Dict[str, Any]:
+        return {**super().parameters(), "buckets": self.buckets, "innerSort": self.innerSort,
+                "maxBucket": self.maxBucket}
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        inner = ALGORITHMS[self.innerSort]
+        if issubclass(inner, BucketSort):
+            raise ValueError("Inner sort of bucket sort can't be bucket sort, crowded buckets "
+                             "are distributed again by maxBucket")
+        # Inner sort is built once, not in every timed sort
+        self.inner = None if self.innerSort == "insertion-sort" else \
+            inner(self.lowerBound, self.upperBound, self.maxSize, self.repeats, seed=self.seed)
+
+    def sort(self, array, key: Optional[Callable[[Any], int]] = None):
+        """
+        :param key: Integer of element, ordered like elements themselves
+        """
+        self._bucketSort(array, key, self._insertionSort if self.inner is None
+                         else self.inner.sort)
+
+    def countedSort(self, array, key: Optional[Callable[[Any], int]] = None):
+        countedSort = self._countedInsertionSort if self.inner is None \
+            else self.inner.countedSort
+        counts = [0, 0]
+
+        def sortBucket(bucket: List[int]) -> None:
+            comparisons, moves = countedSort(bucket)
+            counts[0] += comparisons
+            counts[1] += moves
+
+        elements, distributions = self._bucketSort(array, key, sortBucket)
+        # Finding minimum and maximum compares every distributed element but first twice,
+        # placement and copying back write it twice
+        return counts[0] + 2 * (elements - distributions), counts[1] + 2 * elements
+
+    def _bucketSort(self, array: List[int], key: Optional[Callable[[Any], int]],
+                    sortBucket: Callable[[List[int]], Any]) -> Tuple[int, int]:
+        """
+        Distributes array into buckets and sorts them by sortBucket. Buckets larger than
+        maxBucket are distributed again over range of their own values, buckets of records
+        with equal prefix by following characters of their keys
+        :return: Amount of distributed elements and of distributions
+        """
+        byPrefix = key is None and bool(array) and isinstance(array[0], (Book, str))
+        elements = distributions = 0
+        stack = [(0, len(array), 0)] if len(array) > 1 else []
+        while stack:
+            start, end, offset = stack.pop()
+            part = array[start:end]
+            values = prefixCodes(part, offset) if byPrefix else \
+                numpy.fromiter(map(key, part) if key else part, dtype=numpy.int64, count=len(part))
+            distributed = self._distribute(part, values)
+            if distributed is None:
+                # Equal values, keys whose prefix isn't padded may differ in following characters
+                if byPrefix and values[0] % 0x110000:
+                    stack.append((start, end, offset + PREFIX_LENGTH))
+                else:
+                    sortBucket(part)
+                    array[start:end] = part
+                continue
+
+            output, bounds = distributed
+            elements += len(part)
+            distributions += 1
+            for first, last in bounds:
+                if self.maxBucket is not None and last - first > self.maxBucket:
+                    stack.append((start + first, start + last, offset))
+                else:
+                    bucket = output[first:last]
+                    sortBucket(bucket)
+                    output[first:last] = bucket
+            array[start:end] = output
+        return elements, distributions
+
+    def _distribute(self, array: List[int], values: numpy.ndarray
+                    ) -> Optional[Tuple[List[int], List[Tuple[int, int]]]]:
+        """
+        Places elements into buckets over range of their values
+        :param values: Integer of every element, ordered like elements themselves
+        :return: Elements ordered by bucket and bounds of buckets with more than one element,
+                 None when all values are equal
+        """
+        size = len(array)
+        if size < 2 or values.min() == values.max():
+            return None
+
+        low = values.min()
+        # Range of at least two buckets splits minimum from maximum, so every distribution
+        # makes progress, even with single bucket configured
+        buckets = max(self.buckets or size, 2)
+        # Float scale keeps indices monotone even when range times buckets overflows int64
+        scale = buckets / (float(values.max() - low) + 1)
+        indices = numpy.minimum(((values - low) * scale).astype(numpy.int64), buckets - 1)
+
+        counts = numpy.bincount(indices, minlength=buckets)
+        ends = numpy.cumsum(counts)
+        starts = ends - counts
+        # Every element goes to next free position of its bucket, in original order
+        output = [None] * size
+        positions = starts.tolist()
+        for item, index in zip(array, indices.tolist()):
+            output[positions[index]] = item
+            positions[index] += 1
+        crowded = numpy.flatnonzero(counts > 1)
+        return output, list(zip(starts[crowded].tolist(), ends[crowded].tolist()))
 
     def analyticalTime(self, n):
         return 3 * n
@@ -335,6 +874,38 @@ class BucketSort(InsertionSort):
         return "Sortowanie kubełkowe (Bucket sort)"
 
 
+class QuickBucketSort(BucketSort):
+    """
+    Bucket sort with buckets sorted by quick sort instead of insertion sort
+    """
+    innerSort = "quick-sort"
+
+    def __repr__(self):
+        return "Sortowanie kubełkowe, kubełki sortowane szybko (Bucket sort)"
+
+
+class SingleLevelBucketSort(BucketSort):
+    """
+    Classic bucket sort: single distribution, every bucket is sorted by insertion sort
+    however crowded it is. Degrades to O(n^2) when values cluster in few buckets
+    """
+    maxBucket = None
+
+    def __repr__(self):
+        return "Sortowanie kubełkowe, jednopoziomowe (Bucket sort)"
+
+
+class FixedBucketSort(BucketSort):
+    """
+    Bucket sort with fixed amount of 256 buckets instead of one per element, crowded buckets
+    are distributed again
+    """
+    buckets = 256
+
+    def __repr__(self):
+        return "Sortowanie kubełkowe, 256 kubełków (Bucket sort)"
+
+
 class QuickSort(Algorithm):
     """
     Quick sort algorithm
@@ -342,35 +913,160 @@ class QuickSort(Algorithm):
     Quicksort is a divide-and-conquer algorithm. It works by selecting a 'pivot' element
     from the array and partitioning the other elements into two sub-arrays,
     according to whether they are less than or greater than the pivot.
-    The sub-arrays are then sorted recursively.
+    The sub-arrays are then sorted the same way.
 
-    Worst case: O(n^2)
+    Implementation keeps pending sub-arrays on explicit stack instead of recursion and always
+    continues with the smaller one, so stack holds at most log2(n) ranges. Pivot is chosen by
+    selectable strategy. Three-way partitioning groups elements equal to pivot in the middle,
+    so inputs with many duplicates don't degrade. Introsort depth limit (2 * log2(n) levels)
+    switches range to heap sort, which bounds worst case of adversarial inputs. Ranges
+    shorter than smallRange are finished by insertion sort
+
+    Worst case: O(n^2), O(n*log n) with introsort depth limit
     Average case: O(n*log n)
     Best case: O(n*log n) or O(n)
     """
 
-    @timer
-    def sort(self, array: List[int]) -> int:
-        return self._quickSort(array, 0, len(array) - 1)
-
-    def _quickSort(self, array: List[int], start: int, end: int) -> int:
-        count = 0
-
-        if start < end:
-            pos, count = self._partition(array, start, end)
-            count += self._quickSort(array, start, pos - 1)
-            count += self._quickSort(array, pos + 1, end)
-
-        return count
+    complexity = "n log n"
+    # Pivot strategy: "first", "random", "median-of-three" or "ninther"
+    pivot = "median-of-three"
+    # Three-way partitioning of elements less than, equal to and greater than pivot
+    threeWay = True
+    # Switch to heap sort when partitioning goes deeper than 2 * log2(n) levels
+    introsort = True
+    # Ranges shorter than this are sorted by insertion sort
+    smallRange = 16
+
+    def parameters(self) -> Dict[str, Any]:
+        return {**super().parameters(), "pivot": self.pivot, "threeWay": self.threeWay,
+                "introsort": self.introsort, "smallRange": self.smallRange}
+
+    def depthLimit(self, n: int) -> float:
+        return 2 * max(n, 1).bit_length() if self.introsort else math.inf
+
+    def sort(self, array: List[int]) -> None:
+        choosePivot = self._pivotChooser()
+        partition = self._threeWayPartition if self.threeWay else self._partition
+        stack = [(0, len(array) - 1, self.depthLimit(len(array)))]
+        while stack:
+            start, end, depth = stack.pop()
+            while end - start >= self.smallRange:
+                if depth <= 0:
+                    HeapSort._heapSort(array, start, end)
+                    break
+                depth -= 1
+                index = choosePivot(array, start, end)
+                array[start], array[index] = array[index], array[start]
+                low, high = partition(array, start, end)
+                # Larger side waits on stack, smaller one is sorted right away
+                if low - start < end - high:
+                    stack.append((high + 1, end, depth))
+                    end = low - 1
+                else:
+                    stack.append((start, low - 1, depth))
+                    start = high + 1
+            else:
+                self._insertionSort(array, start, end)
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        choosePivot = self._countedPivotChooser()
+        partition = self._countedThreeWayPartition if self.threeWay else self._countedPartition
+        comparisons = moves = 0
+        stack = [(0, len(array) - 1, self.depthLimit(len(array)))]
+        while stack:
+            start, end, depth = stack.pop()
+            while end - start >= self.smallRange:
+                if depth <= 0:
+                    heapComparisons, heapMoves = HeapSort._countedHeapSort(array, start, end)
+                    comparisons += heapComparisons
+                    moves += heapMoves
+                    break
+                depth -= 1
+                index, pivotComparisons = choosePivot(array, start, end)
+                array[start], array[index] = array[index], array[start]
+                low, high, partComparisons, partMoves = partition(array, start, end)
+                comparisons += pivotComparisons + partComparisons
+                moves += 2 + partMoves
+                if low - start < end - high:
+                    stack.append((high + 1, end, depth))
+                    end = low - 1
+                else:
+                    stack.append((start, low - 1, depth))
+                    start = high + 1
+            else:
+                sortComparisons, sortMoves = self._countedInsertionSort(array, start, end)
+                comparisons += sortComparisons
+                moves += sortMoves
+        return comparisons, moves
 
-    def _partition(self, array: List[int], start: int, end: int) -> Tuple[Union[int, Any], int]:
+    def _pivotChooser(self) -> Callable[[List[int], int, int], int]:
+        """
+        Function choosing index of pivot of range [start, end] by pivot strategy
+        """
+        if self.pivot == "first":
+            return lambda array, start, end: start
+        if self.pivot == "random":
+            # Seeded by inputs, so countedSort picks the same pivots as sort
+            randint = random.Random(self.inputs.entropy).randint
+            return lambda array, start, end: randint(start, end)
+        if self.pivot == "median-of-three":
+            return lambda array, start, end: self._median(array, start, (start + end) // 2, end)
+        if self.pivot == "ninther":
+            return self._ninther
+        raise ValueError(f"Unknown pivot strategy '{self.pivot}'")
+
+    def _countedPivotChooser(self) -> Callable[[List[int], int, int], Tuple[int, int]]:
+        """
+        Counting twin of "_pivotChooser", function also returns amount of comparisons
+        """
+        if self.pivot in ("first", "random"):
+            choosePivot = self._pivotChooser()
+            return lambda array, start, end: (choosePivot(array, start, end), 0)
+        if self.pivot == "median-of-three":
+            return lambda array, start, end: (
+                self._median(array, start, (start + end) // 2, end), 3)
+        if self.pivot == "ninther":
+            return lambda array, start, end: (
+                self._ninther(array, start, end), 12 if end - start >= 40 else 3)
+        raise ValueError(f"Unknown pivot strategy '{self.pivot}'")
+
+    @staticmethod
+    def _median(array: List[int], a: int, b: int, c: int) -> int:
+        """
+        Index of median of three elements, three comparisons
+        """
+        if array[a] < array[b]:
+            if array[b] < array[c]:
+                return b
+            return c if array[a] < array[c] else a
+        if array[a] < array[c]:
+            return a
+        return c if array[b] < array[c] else b
+
+    def _ninther(self, array: List[int], start: int, end: int) -> int:
+        """
+        Tukey's ninther: median of medians of three evenly spaced triples. Ranges shorter
+        than 40 elements use median of three
+        """
+        if end - start < 40:
+            return self._median(array, start, (start + end) // 2, end)
+        step = (end - start) // 8
+        middle = (start + end) // 2
+        median = self._median
+        return median(array, median(array, start, start + step, start + 2 * step),
+                      median(array, middle - step, middle, middle + step),
+                      median(array, end - 2 * step, end - step, end))
+
+    def _partition(self, array: List[int], start: int, end: int) -> Tuple[int, int]:
+        """
+        Two-way partitioning around pivot array[start]
+        :return: Range of pivot after partitioning, a single position
+        """
         pivot = array[start]
         low = start + 1
         high = end
-        count = 0
 
         while True:
-            count += 1
             # If the current value we're looking at is larger than the pivot
             # it's in the right place (right side of pivot) and we can move left,
             # to the next element.
@@ -378,12 +1074,10 @@ class QuickSort(Algorithm):
             # indicates we have already moved all the elements to their correct side of the pivot
             while low <= high and array[high] >= pivot:
                 high = high - 1
-                count += 1
 
             # Opposite process of the one above
             while low <= high and array[low] <= pivot:
                 low = low + 1
-                count += 1
 
             # We either found a value for both high and low that is out of order
             # or low is higher than high, in which case we exit the loop
@@ -396,7 +1090,174 @@ class QuickSort(Algorithm):
 
         array[start], array[high] = array[high], array[start]
 
-        return high, count
+        return high, high
+
+    def _countedPartition(self, array: List[int], start: int, end: int
+                          ) -> Tuple[int, int, int, int]:
+        """
+        Counting twin of "_partition"
+        :return: Range of pivot, amount of comparisons and element writes
+        """
+        pivot = array[start]
+        low = start + 1
+        high = end
+        comparisons = moves = 0
+
+        while True:
+            while low <= high:
+                comparisons += 1
+                if not array[high] >= pivot:
+                    break
+                high = high - 1
+
+            while low <= high:
+                comparisons += 1
+                if not array[low] <= pivot:
+                    break
+                low = low + 1
+
+            if low <= high:
+                array[low], array[high] = array[high], array[low]
+                moves += 2
+            else:
+                break
+
+        array[start], array[high] = array[high], array[start]
+        moves += 2
+
+        return high, high, comparisons, moves
+
+    def _threeWayPartition(self, array: List[int], start: int, end: int) -> Tuple[int, int]:
+        """
+        Bentley-McIlroy three-way partitioning around pivot array[start]. Scans from both
+        ends like two-way partitioning, elements equal to pivot are swapped to ends of range
+        and moved to the middle at the end, so ordered runs of input stay ordered
+        :return: Range of elements equal to pivot, less ones are before it, greater ones after
+        """
+        pivot = array[start]
+        low, high = start, end + 1
+        lowEqual, highEqual = start, end + 1
+        while True:
+            low += 1
+            while array[low] < pivot and low != end:
+                low += 1
+            high -= 1
+            while pivot < array[high]:
+                high -= 1
+
+            if low == high and array[low] == pivot:
+                lowEqual += 1
+                array[lowEqual], array[low] = array[low], array[lowEqual]
+            if low >= high:
+                break
+
+            array[low], array[high] = array[high], array[low]
+            if array[low] == pivot:
+                lowEqual += 1
+                array[lowEqual], array[low] = array[low], array[lowEqual]
+            if array[high] == pivot:
+                highEqual -= 1
+                array[highEqual], array[high] = array[high], array[highEqual]
+
+        # Equal elements from both ends go next to the crossing point
+        low = high + 1
+        for index in range(start, lowEqual + 1):
+            array[index], array[high] = array[high], array[index]
+            high -= 1
+        for index in range(end, highEqual - 1, -1):
+            array[index], array[low] = array[low], array[index]
+            low += 1
+        return high + 1, low - 1
+
+    def _countedThreeWayPartition(self, array: List[int], start: int, end: int
+                                  ) -> Tuple[int, int, int, int]:
+        """
+        Counting twin of "_threeWayPartition"
+        :return: Range of elements equal to pivot, amount of comparisons and element writes
+        """
+        pivot = array[start]
+        low, high = start, end + 1
+        lowEqual, highEqual = start, end + 1
+        comparisons = moves = 0
+        while True:
+            low += 1
+            comparisons += 1
+            while array[low] < pivot and low != end:
+                low += 1
+                comparisons += 1
+            high -= 1
+            comparisons += 1
+            while pivot < array[high]:
+                high -= 1
+                comparisons += 1
+
+            if low == high:
+                comparisons += 1
+                if array[low] == pivot:
+                    lowEqual += 1
+                    array[lowEqual], array[low] = array[low], array[lowEqual]
+                    moves += 2
+            if low >= high:
+                break
+
+            array[low], array[high] = array[high], array[low]
+            comparisons += 2
+            moves += 2
+            if array[low] == pivot:
+                lowEqual += 1
+                array[lowEqual], array[low] = array[low], array[lowEqual]
+                moves += 2
+            if array[high] == pivot:
+                highEqual -= 1
+                array[highEqual], array[high] = array[high], array[highEqual]
+                moves += 2
+
+        low = high + 1
+        for index in range(start, lowEqual + 1):
+            array[index], array[high] = array[high], array[index]
+            high -= 1
+        for index in range(end, highEqual - 1, -1):
+            array[index], array[low] = array[low], array[index]
+            low += 1
+        moves += 2 * (lowEqual - start + 1 + end - highEqual + 1)
+        return high + 1, low - 1, comparisons, moves
+
+    @staticmethod
+    def _insertionSort(array: List[int], start: int, end: int) -> None:
+        """
+        Insertion sort of range [start, end]
+        """
+        for index in range(start + 1, end + 1):
+            currentValue = array[index]
+            currentIndex = index
+
+            while currentIndex > start and array[currentIndex - 1] > currentValue:
+                array[currentIndex] = array[currentIndex - 1]
+                currentIndex -= 1
+
+            array[currentIndex] = currentValue
+
+    @staticmethod
+    def _countedInsertionSort(array: List[int], start: int, end: int) -> Tuple[int, int]:
+        """
+        Counting twin of "_insertionSort"
+        """
+        comparisons = moves = 0
+        for index in range(start + 1, end + 1):
+            currentValue = array[index]
+            currentIndex = index
+
+            while currentIndex > start:
+                comparisons += 1
+                if not array[currentIndex - 1] > currentValue:
+                    break
+                array[currentIndex] = array[currentIndex - 1]
+                currentIndex -= 1
+                moves += 1
+
+            array[currentIndex] = currentValue
+            moves += 1
+        return comparisons, moves
 
     def analyticalTime(self, n):
         return n * (math.log(n, 2) + 1)
@@ -405,6 +1266,298 @@ class QuickSort(Algorithm):
         return "Szybkie sortowanie (Quick sort)"
 
 
+class FirstPivotQuickSort(QuickSort):
+    """
+    Classic quick sort: first element as pivot, two-way partitioning and no depth limit.
+    Degrades to O(n^2) on sorted inputs and inputs with many duplicates
+    """
+    pivot = "first"
+    threeWay = False
+    introsort = False
+
+    def __repr__(self):
+        return "Szybkie sortowanie, pierwszy element jako pivot (Quick sort)"
+
+
+class RandomPivotQuickSort(QuickSort):
+    """
+    Quick sort with randomly chosen pivot
+    """
+    pivot = "random"
+
+    def __repr__(self):
+        return "Szybkie sortowanie, losowy pivot (Quick sort)"
+
+
+class NintherQuickSort(QuickSort):
+    """
+    Quick sort with Tukey's ninther as pivot
+    """
+    pivot = "ninther"
+
+    def __repr__(self):
+        return "Szybkie sortowanie, pivot ninther (Quick sort)"
+
+
+class MergeSort(Algorithm):
+    """
+    Merge sort algorithm
+
+    Merge sort divides array into two halves, sorts each of them and merges sorted halves
+    into one by repeatedly taking smaller of their first elements. Elements of left half
+    are moved into buffer before merge, so single buffer of array size, allocated once
+    per sort, serves every merge. Merge is skipped when halves are already in order,
+    and equal elements keep their order (stable sort)
+
+    Worst case: O(n*log n)
+    Average case: O(n*log n)
+    Best case: O(n) with already ordered halves
+    """
+
+    complexity = "n log n"
+
+    def sort(self, array: List[int]) -> None:
+        self._topDown(array, array[:], 0, len(array))
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        counts = [0, 0]
+        self._countedTopDown(array, array[:], 0, len(array), counts)
+        return counts[0], counts[1]
+
+    def _topDown(self, array: List[int], buffer: List[int], start: int, end: int) -> None:
+        """
+        Sorts range [start, end) by sorting and merging its halves
+        """
+        if end - start < 2:
+            return
+        middle = (start + end) // 2
+        self._topDown(array, buffer, start, middle)
+        self._topDown(array, buffer, middle, end)
+        if array[middle] < array[middle - 1]:
+            self._merge(array, buffer, start, middle, end)
+
+    def _countedTopDown(self, array: List[int], buffer: List[int], start: int, end: int,
+                        counts: List[int]) -> None:
+        """
+        Counting twin of "_topDown", adds comparisons and moves to counts
+        """
+        if end - start < 2:
+            return
+        middle = (start + end) // 2
+        self._countedTopDown(array, buffer, start, middle, counts)
+        self._countedTopDown(array, buffer, middle, end, counts)
+        counts[0] += 1
+        if array[middle] < array[middle - 1]:
+            self._countedMerge(array, buffer, start, middle, end, counts)
+
+    @staticmethod
+    def _merge(array: List[int], buffer: List[int], start: int, middle: int, end: int
+               ) -> None:
+        """
+        Merges sorted ranges [start, middle) and [middle, end)
+        """
+        buffer[start:middle] = array[start:middle]
+        left, right, index = start, middle, start
+        while left < middle and right < end:
+            if array[right] < buffer[left]:
+                array[index] = array[right]
+                right += 1
+            else:
+                array[index] = buffer[left]
+                left += 1
+            index += 1
+        # Rest of right half is already in place
+        array[index:index + middle - left] = buffer[left:middle]
+
+    @staticmethod
+    def _countedMerge(array: List[int], buffer: List[int], start: int, middle: int, end: int,
+                      counts: List[int]) -> None:
+        """
+        Counting twin of "_merge", adds comparisons and moves to counts
+        """
+        buffer[start:middle] = array[start:middle]
+        left, right, index = start, middle, start
+        while left < middle and right < end:
+            counts[0] += 1
+            if array[right] < buffer[left]:
+                array[index] = array[right]
+                right += 1
+            else:
+                array[index] = buffer[left]
+                left += 1
+            index += 1
+        array[index:index + middle - left] = buffer[left:middle]
+        counts[1] += 2 * (middle - start) + right - middle
+
+    def analyticalTime(self, n):
+        return n * (math.log(n, 2) + 1)
+
+    def __repr__(self):
+        return "Sortowanie przez scalanie (Merge sort)"
+
+
+class BottomUpMergeSort(MergeSort):
+    """
+    Bottom-up merge sort: without recursion, merges neighbouring runs of width 1, 2, 4, ...
+    until single run spans whole array
+    """
+
+    def sort(self, array: List[int]) -> None:
+        buffer, size, width = array[:], len(array), 1
+        while width < size:
+            for start in range(0, size - width, 2 * width):
+                middle, end = start + width, min(start + 2 * width, size)
+                if array[middle] < array[middle - 1]:
+                    self._merge(array, buffer, start, middle, end)
+            width *= 2
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        buffer, size, width = array[:], len(array), 1
+        counts = [0, 0]
+        while width < size:
+            for start in range(0, size - width, 2 * width):
+                middle, end = start + width, min(start + 2 * width, size)
+                counts[0] += 1
+                if array[middle] < array[middle - 1]:
+                    self._countedMerge(array, buffer, start, middle, end, counts)
+            width *= 2
+        return counts[0], counts[1]
+
+    def __repr__(self):
+        return "Sortowanie przez scalanie wstępujące (Bottom-up merge sort)"
+
+
+class HeapSort(Algorithm):
+    """
+    Heap sort algorithm
+
+    Heap sort builds binary max-heap in array, in which every element is not less than
+    its children, then repeatedly swaps its root, the maximum, with last element of heap,
+    shrinks heap by one and sifts new root down to restore heap order. It sorts in place
+    and its worst case is O(n*log n), which makes it fallback of quick sort
+
+    Worst case: O(n*log n)
+    Average case: O(n*log n)
+    Best case: O(n*log n)
+    """
+
+    complexity = "n log n"
+
+    def sort(self, array: List[int]) -> None:
+        self._heapSort(array, 0, len(array) - 1)
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        return self._countedHeapSort(array, 0, len(array) - 1)
+
+    @staticmethod
+    def _heapSort(array: List[int], start: int, end: int) -> None:
+        """
+        Heap sort of range [start, end], also fallback of quick sort ranges partitioned
+        too deep
+        """
+        size = end - start + 1
+
+        def siftDown(root: int, size: int) -> None:
+            value = array[start + root]
+            child = 2 * root + 1
+            while child < size:
+                if child + 1 < size and array[start + child] < array[start + child + 1]:
+                    child += 1
+                if not value < array[start + child]:
+                    break
+                array[start + root] = array[start + child]
+                root, child = child, 2 * child + 1
+            array[start + root] = value
+
+        for root in range(size // 2 - 1, -1, -1):
+            siftDown(root, size)
+        for last in range(size - 1, 0, -1):
+            array[start], array[start + last] = array[start + last], array[start]
+            siftDown(0, last)
+
+    @staticmethod
+    def _countedHeapSort(array: List[int], start: int, end: int) -> Tuple[int, int]:
+        """
+        Counting twin of "_heapSort"
+        """
+        size = end - start + 1
+        counts = [0, 0]
+
+        def siftDown(root: int, size: int) -> None:
+            value = array[start + root]
+            child = 2 * root + 1
+            while child < size:
+                if child + 1 < size:
+                    counts[0] += 1
+                    if array[start + child] < array[start + child + 1]:
+                        child += 1
+                counts[0] += 1
+                if not value < array[start + child]:
+                    break
+                array[start + root] = array[start + child]
+                counts[1] += 1
+                root, child = child, 2 * child + 1
+            array[start + root] = value
+            counts[1] += 1
+
+        for root in range(size // 2 - 1, -1, -1):
+            siftDown(root, size)
+        for last in range(size - 1, 0, -1):
+            array[start], array[start + last] = array[start + last], array[start]
+            counts[1] += 2
+            siftDown(0, last)
+        return counts[0], counts[1]
+
+    def analyticalTime(self, n):
+        return n * (math.log(n, 2) + 1)
+
+    def __repr__(self):
+        return "Sortowanie przez kopcowanie (Heap sort)"
+
+
+class TimSort(Algorithm):
+    """
+    Baseline of python's built-in list.sort, Timsort implemented in C
+
+    Timsort finds runs already in order, extends short ones by binary insertion sort
+    and merges them by galloping merge, so it's adaptive to partially sorted inputs.
+    Comparisons are counted by key wrapper, which counts calls of "<". Moves inside
+    list.sort can't be observed, only writes of sorted elements back into array
+    are counted
+
+    Worst case: O(n*log n)
+    Average case: O(n*log n)
+    Best case: O(n)
+    """
+
+    complexity = "n log n"
+
+    def sort(self, array: List[int]) -> None:
+        array.sort()
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        counts = [0]
+
+        class CountedKey:
+            __slots__ = ("value",)
+
+            def __init__(self, value) -> None:
+                self.value = value
+
+            def __lt__(self, other) -> bool:
+                counts[0] += 1
+                return self.value < other.value
+
+        array[:] = [key.value for key in sorted(map(CountedKey, array))]
+        return counts[0], len(array)
+
+    def analyticalTime(self, n):
+        return n * (math.log(n, 2) + 1)
+
+    def __repr__(self):
+        return "Sortowanie wbudowane (Timsort, list.sort)"
+
+
 class SelectionSort(Algorithm):
     """
     Selection sort algorithm
@@ -422,28 +1575,205 @@ class SelectionSort(Algorithm):
     Best case: O(n^2)
     """
 
-    @timer
-    def sort(self, array: List[int]) -> int:
+    complexity = "n^2"
+
+    def sort(self, array: List[int]) -> None:
         # index indicates how many items were sorted
-        count = 0
         for index in range(len(array) - 1):
-            count += 1
             # To find the minimum value of the unsorted segment
             # We first assume that the first element is the lowest
             minIndex = index
             # We then use j to loop through the remaining elements
-            for j in range(index + 1, len(array) - 1):
-                count += 1
+            for j in range(index + 1, len(array)):
                 # Update the min index if the element at j is lower than it
                 if array[j] < array[minIndex]:
                     minIndex = j
             # After finding the lowest item of the unsorted regions,
             # swap with the first unsorted item
             array[index], array[minIndex] = array[minIndex], array[index]
-        return count
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        comparisons = moves = 0
+        for index in range(len(array) - 1):
+            minIndex = index
+            for j in range(index + 1, len(array)):
+                comparisons += 1
+                if array[j] < array[minIndex]:
+                    minIndex = j
+            array[index], array[minIndex] = array[minIndex], array[index]
+            moves += 2
+        return comparisons, moves
 
     def analyticalTime(self, n):
         return n ** 2
 
     def __repr__(self):
         return "Sortowanie selektywne (Selection sort)"
+
+
+class CountingSort(Algorithm):
+    """
+    Counting sort algorithm
+
+    Counting sort counts occurrences of every value of range between minimum and maximum
+    of array, which is at most upperBound - lowerBound, and writes values back in order of
+    range, each as many times as it occurred. It doesn't compare elements at all,
+    so it sorts only integers. Count array of the whole range is allocated by every sort,
+    so bounds wider than maxRange are refused
+
+    Worst case: O(n + k) where k is range of values
+    Average case: O(n + k)
+    Best case: O(n + k)
+    """
+
+    complexity = "n"
+    integersOnly = True
+    # Count array of 4M values takes about 32 MB and its scan dominates time of any sort
+    maxRange = 1 << 22
+
+    def sort(self, array: List[int]) -> None:
+        if len(array) < 2:
+            return
+        low = min(array)
+        counts = [0] * (max(array) - low + 1)
+        for value in array:
+            counts[value - low] += 1
+        array[:] = itertools.chain.from_iterable(
+            itertools.repeat(value, count) for value, count in enumerate(counts, low) if count)
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        self.sort(array)
+        # Finding minimum and maximum compares every element but first twice,
+        # every element is written once
+        return 2 * max(len(array) - 1, 0), len(array)
+
+    def analyticalTime(self, n):
+        return n + self.upperBound - self.lowerBound
+
+    def __repr__(self):
+        return "Sortowanie przez zliczanie (Counting sort)"
+
+
+class RadixSort(Algorithm):
+    """
+    LSD radix sort algorithm
+
+    Least significant digit radix sort distributes values shifted by minimum of array
+    into 2^bits buckets by their lowest digit of given bits, gathers buckets in order
+    and repeats with following digits. Distribution is stable, so after pass of highest
+    digit of range values are sorted. Amount of passes is given by range of values,
+    at most upperBound - lowerBound. It doesn't compare elements at all, so it sorts
+    only integers
+
+    Worst case: O(d * (n + 2^bits)) where d is amount of digits of range
+    Average case: O(d * (n + 2^bits))
+    Best case: O(d * (n + 2^bits))
+    """
+
+    complexity = "n"
+    integersOnly = True
+    # Bits of one digit, one pass distributes into 2^bits buckets
+    bits = 8
+
+    def parameters(self) -> Dict[str, Any]:
+        return {**super().parameters(), "bits": self.bits}
+
+    def passes(self, span: int) -> int:
+        """
+        Amount of digits of values at most span above minimum, at least one
+        """
+        return max(-(-span.bit_length() // self.bits), 1)
+
+    def sort(self, array: List[int]) -> None:
+        self._radixSort(array)
+
+    def countedSort(self, array: List[int]) -> Tuple[int, int]:
+        passes = self._radixSort(array)
+        # Finding minimum and maximum compares every element but first twice,
+        # every pass writes every element into bucket and back into array
+        return 2 * max(len(array) - 1, 0), 2 * passes * len(array)
+
+    def _radixSort(self, array: List[int]) -> int:
+        """
+        Sorts array in place
+        :return: Amount of passes
+        """
+        if len(array) < 2:
+            return 0
+        low = min(array)
+        keys = [value - low for value in array]
+        mask = (1 << self.bits) - 1
+        passes = self.passes(max(keys))
+        for shift in range(0, passes * self.bits, self.bits):
+            buckets = [[] for _ in range(mask + 1)]
+            for key in keys:
+                buckets[key >> shift & mask].append(key)
+            keys = list(itertools.chain.from_iterable(buckets))
+        array[:] = [key + low for key in keys]
+        return passes
+
+    def analyticalTime(self, n):
+        return self.passes(self.upperBound - self.lowerBound) * (n + 2 ** self.bits)
+
+    def __repr__(self):
+        return "Sortowanie pozycyjne, cyfry 8-bitowe (Radix sort)"
+
+
+class ElevenBitRadixSort(RadixSort):
+    """
+    LSD radix sort with 11-bit digits, 2048 buckets: fewer passes than bytes,
+    e.g. three instead of four for 32-bit range
+    """
+    bits = 11
+
+    def __repr__(self):
+        return "Sortowanie pozycyjne, cyfry 11-bitowe (Radix sort)"
+
+
+class NumpyRadixSort(RadixSort):
+    """
+    LSD radix sort with passes done by numpy: every pass is stable argsort of 16-bit
+    digits, which numpy performs by counting (radix) sort in C, and values are reordered
+    by it at once. Digits must fit into 16 bits
+    """
+    bits = 16
+
+    def _radixSort(self, array: List[int]) -> int:
+        if len(array) < 2:
+            return 0
+        values = numpy.array(array, dtype=numpy.int64)
+        low = values.min()
+        keys = values - low
+        mask = (1 << self.bits) - 1
+        passes = self.passes(int(keys.max()))
+        for shift in range(0, passes * self.bits, self.bits):
+            digits = (keys >> shift & mask).astype(numpy.uint16)
+            keys = keys[numpy.argsort(digits, kind="stable")]
+        array[:] = (keys + low).tolist()
+        return passes
+
+    def __repr__(self):
+        return "Sortowanie pozycyjne NumPy, cyfry 16-bitowe (Radix sort)"
+
+
+ALGORITHMS = {
+    "bucket-sort": BucketSort,
+    "bucket-sort-256": FixedBucketSort,
+    "bucket-sort-quick": QuickBucketSort,
+    "bucket-sort-single-level": SingleLevelBucketSort,
+    "bubble-sort": BubbleSort,
+    "counting-sort": CountingSort,
+    "heap-sort": HeapSort,
+    "insertion-sort": InsertionSort,
+    "merge-sort": MergeSort,
+    "merge-sort-bottom-up": BottomUpMergeSort,
+    "quick-sort": QuickSort,
+    "quick-sort-first": FirstPivotQuickSort,
+    "quick-sort-random": RandomPivotQuickSort,
+    "quick-sort-ninther": NintherQuickSort,
+    "radix-sort": RadixSort,
+    "radix-sort-11": ElevenBitRadixSort,
+    "radix-sort-numpy": NumpyRadixSort,
+    "selection-sort": SelectionSort,
+    "timsort": TimSort,
+}
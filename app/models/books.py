@@ -0,0 +1,99 @@
+from datetime import date
+from typing import Dict, List, Sequence, Union
+
+import numpy
+
+# Leading code points of sort key encoded by prefixCodes, three of them fit into 64 bits
+PREFIX_LENGTH = 3
+
+
+class Book:
+    """
+    Book record, ordered by title regardless of letter case
+
+    Record has no instance dict (__slots__) and its sort key, casefolded title, is computed
+    once at construction, so comparisons in sort don't allocate new strings
+    """
+    __slots__ = ("signature", "title", "author", "publish_date", "key")
+
+    def __init__(self, signature: str, title: str, author: str, publish_date: date) -> None:
+        self.signature = signature
+        self.title = title
+        self.author = author
+        self.publish_date = publish_date
+        key = title.casefold()
+        # Title which is already casefolded is shared instead of kept twice
+        self.key = title if key == title else key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __ne__(self, other):
+        return self.key != other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+    def __hash__(self):
+        return hash(self.key)
+
+    def __str__(self):
+        return str(self.title)
+
+    def __repr__(self):
+        return (f"Book(signature={self.signature!r}, title={self.title!r}, "
+                f"author={self.author!r}, publish_date={self.publish_date!r})")
+
+
+BOOKS = (
+    Book(title="Król", author="Szczepan Twardoch", signature="9788308070956",
+         publish_date=date(2020, 10, 28)),
+    Book(title="Opowieść podręcznej", author="Margaret Atwood", signature="9788380324398",
+         publish_date=date(2020, 2, 26)),
+    Book(title="27 śmierci Toby’ego Obeda", author="Joanna Gierak-Onoszko",
+         signature="9788365970343", publish_date=date(2019, 5, 22)),
+    Book(title="Gdzie śpiewają raki", author="Delia Owens", signature="9788381392686",
+         publish_date=date(2019, 10, 30)),
+    Book(title="Siedem sióstr", author="Lucinda Riley", signature="9788381257947",
+         publish_date=date(2019, 11, 13)),
+)
+
+
+def undecorate(records: Sequence[Book], keys: Sequence[str]) -> List[Book]:
+    """
+    Records in order of sorted keys, second half of decorate-sort-undecorate.
+    Records with equal keys keep their original order
+    :param records: Unsorted records
+    :param keys: Sorted keys of records
+    :return: Sorted records
+    """
+    groups: Dict[str, List[Book]] = {}
+    for record in reversed(records):
+        groups.setdefault(record.key, []).append(record)
+    return [groups[key].pop() for key in keys]
+
+
+def prefixCodes(items: Sequence[Union[Book, str]], offset: int = 0) -> numpy.ndarray:
+    """
+    Integers of PREFIX_LENGTH code points of sort keys of records or strings, ordered like keys
+    themselves: a < b implies code of a <= code of b. Shorter keys are padded by code point 0
+    :param offset: Characters of keys skipped before prefix
+    :return: Code of every item
+    """
+    end = offset + PREFIX_LENGTH
+    keys = [item.key for item in items] if items and isinstance(items[0], Book) else items
+    prefixes = numpy.array([key[offset:end] for key in keys], dtype=f"<U{PREFIX_LENGTH}")
+    points = prefixes.view(numpy.uint32).reshape(-1, PREFIX_LENGTH).astype(numpy.int64)
+    codes = numpy.zeros(len(points), dtype=numpy.int64)
+    for column in points.T:
+        codes = codes * 0x110000 + column
+    return codes
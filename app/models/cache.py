@@ -0,0 +1,163 @@
+import hashlib
+import inspect
+import io
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional, Tuple, Union
+
+import numpy
+
+from . import (algorithms, books, complexity, corpus, harness, inputs, measurements, samples,
+               sampling)
+from .measurements import Measurements
+
+
+def codeVersion() -> str:
+    """
+    Fingerprint of code which produces measurements: algorithms and their inputs, timing
+    harness, sampling of sizes and fitted estimates, so results of changed code are never
+    served from cache
+    """
+    digest = hashlib.sha1()
+    for module in (algorithms, books, complexity, corpus, harness, inputs, measurements, samples,
+                   sampling):
+        try:
+            digest.update(inspect.getsource(module).encode())
+        except (OSError, TypeError):
+            # Frozen builds ship without sources
+            digest.update(module.__name__.encode())
+    return digest.hexdigest()
+
+
+def defaultPath() -> Path:
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "algorithm-analyzer" / "results.sqlite"
+
+
+class ResultCache:
+    """
+    Two level cache of analysis results
+
+    Results are kept in in-memory LRU and in SQLite store on disk, which survives restarts.
+    Disk store is capped by total size of results, least recently used ones are evicted first.
+    Safe to use from worker threads, every operation opens its own connection
+    """
+    version = codeVersion()
+
+    def __init__(self, path: Union[str, Path, None] = None, memoryItems: int = 32,
+                 maxBytes: int = 64 * 1024 * 1024) -> None:
+        self.path = Path(path) if path is not None else defaultPath()
+        self.memoryItems = memoryItems
+        self.maxBytes = maxBytes
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def key(self, algorithm: "algorithms.Algorithm", exclude: Tuple[str, ...] = ()) -> str:
+        """
+        Key of algorithm analysis: its class, parameters which define result and code version
+        :param algorithm: Algorithm to analyze
+        :param exclude: Parameters left out of key
+        """
+        parameters = {"algorithm": type(algorithm).__name__, "version": self.version,
+                      **algorithm.parameters()}
+        for name in exclude:
+            parameters.pop(name, None)
+        return hashlib.sha1(json.dumps(parameters, sort_keys=True).encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Measurements]:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+
+            data = None
+            try:
+                with self._connect() as connection:
+                    row = connection.execute("SELECT data FROM results WHERE key = ?",
+                                             (key,)).fetchone()
+                    if row is not None:
+                        connection.execute("UPDATE results SET accessed = ? WHERE key = ?",
+                                           (time.time(), key))
+                        data = row[0]
+            except (sqlite3.Error, OSError):
+                return None
+            if data is None:
+                return None
+
+            measurements = self._loads(data)
+            self._remember(key, measurements)
+            return measurements
+
+    def put(self, key: str, measurements: Measurements) -> None:
+        data = self._dumps(measurements)
+        with self._lock:
+            self._remember(key, measurements)
+            try:
+                with self._connect() as connection:
+                    connection.execute(
+                        "REPLACE INTO results (key, data, size, accessed) VALUES (?, ?, ?, ?)",
+                        (key, data, len(data), time.time()))
+                    self._evict(connection)
+            except (sqlite3.Error, OSError):
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+            try:
+                with self._connect() as connection:
+                    connection.execute("DELETE FROM results")
+            except (sqlite3.Error, OSError):
+                pass
+
+    def _remember(self, key: str, measurements: Measurements) -> None:
+        self._memory[key] = measurements
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memoryItems:
+            self._memory.popitem(last=False)
+
+    def _evict(self, connection: sqlite3.Connection) -> None:
+        total = connection.execute("SELECT COALESCE(SUM(size), 0) FROM results").fetchone()[0]
+        rows = connection.execute("SELECT key, size FROM results ORDER BY accessed")
+        for key, size in rows.fetchall():
+            if total <= self.maxBytes:
+                break
+            connection.execute("DELETE FROM results WHERE key = ?", (key,))
+            total -= size
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Connection which commits on success and is always closed
+        """
+        if not self._initialized:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(str(self.path))
+        try:
+            with connection:
+                if not self._initialized:
+                    connection.execute(
+                        "CREATE TABLE IF NOT EXISTS results "
+                        "(key TEXT PRIMARY KEY, data BLOB, size INTEGER, accessed REAL)")
+                    self._initialized = True
+                yield connection
+        finally:
+            connection.close()
+
+    @staticmethod
+    def _dumps(measurements: Measurements) -> bytes:
+        buffer = io.BytesIO()
+        numpy.savez_compressed(buffer, **measurements)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _loads(data: bytes) -> Measurements:
+        with numpy.load(io.BytesIO(data)) as archive:
+            return Measurements({key: archive[key] for key in archive.files})
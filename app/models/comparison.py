@@ -0,0 +1,171 @@
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from .algorithms import ALGORITHMS, Algorithm, AnalysisCancelled, parallelUnits
+from .inputs import InputGenerator
+from .measurements import Measurements
+from .samples import Sample
+from .sampling import geometricSizes
+
+
+class Comparison:
+    """
+    Sweep of several algorithms over identical inputs
+
+    Algorithms share one seed, repeats and harness, so every (size, repeat) work unit sorts
+    the same arrays with each of them. One unit measures all algorithms in one process, which
+    generates input block once (blocks are cached per generator) and hands every algorithm
+    its own copy. Units are spread over process pool like units of single algorithm sweep.
+    Comparison of several input profiles measures every algorithm on every profile, profiles
+    are arrangements of the same seeded values
+    """
+    # Columns of every algorithm in joined table
+    columns = ("calculated_time", "comparisons", "moves", "peak_memory")
+
+    def __init__(self, algorithms: Dict[str, Algorithm], workers: int = 1) -> None:
+        if not algorithms:
+            raise ValueError("Comparison needs at least one algorithm")
+        first = next(iter(algorithms.values()))
+        for algorithm in algorithms.values():
+            if (algorithm.inputs.entropy, algorithm.lowerBound, algorithm.upperBound,
+                    algorithm.corpus, algorithm.repeats, algorithm.harness) != \
+                    (first.inputs.entropy, first.lowerBound, first.upperBound,
+                     first.corpus, first.repeats, first.harness):
+                raise ValueError("Compared algorithms must share inputs, repeats and harness")
+        self.algorithms = algorithms
+        self.workers = workers
+        self.maxSize = first.maxSize
+        self.repeats = first.repeats
+
+    @classmethod
+    def create(cls, names: Iterable[str], lowerBound: int, upperBound: int, maxSize: int,
+               repeats: int, workers: int = 1, seed: Optional[int] = None,
+               profiles: Sequence[str] = (), **options) -> "Comparison":
+        """
+        Comparison of algorithms from ALGORITHMS with common seed, picked at random when
+        there is none
+        :param names: Keys of ALGORITHMS, integer sorts are left out with corpus, as well as
+                      algorithms which can't sort values of bounds
+        :param profiles: Input profiles, every algorithm is measured on each of them when
+                         there are more than one. Algorithm is named by label(name, profile)
+        :param options: Other keyword arguments of Algorithm, e.g. sampling
+        """
+        entropy = InputGenerator(lowerBound, upperBound, seed).entropy
+        if options.get("corpus") is not None:
+            # Records of corpus are compared only by algorithms which can sort them
+            names = [name for name in names if not ALGORITHMS[name].integersOnly]
+        # Algorithms which can't sort range of values are left out as well
+        names = [name for name in names if ALGORITHMS[name].fitsRange(lowerBound, upperBound)]
+        if len(profiles) == 1:
+            options["profile"] = profiles[0]
+        if len(profiles) <= 1:
+            return cls({name: ALGORITHMS[name](lowerBound, upperBound, maxSize, repeats,
+                                               seed=entropy, **options)
+                        for name in names}, workers)
+        # Algorithms of one profile are neighbours, so they share cached input block
+        return cls({cls.label(name, profile): ALGORITHMS[name](
+            lowerBound, upperBound, maxSize, repeats, seed=entropy, profile=profile, **options)
+            for profile in profiles for name in names}, workers)
+
+    @staticmethod
+    def label(name: str, profile: str) -> str:
+        """
+        Name of algorithm measured on one of several compared profiles
+        """
+        return f"{name}, {profile}"
+
+    @staticmethod
+    def columnKey(name: str, key: str) -> str:
+        """
+        Column of joined table holding column key of algorithm name
+        """
+        return f"{key} ({name})"
+
+    def sizes(self) -> List[int]:
+        """
+        Sizes of first algorithm. Adaptive sampling refines sizes by single curve,
+        so comparison measures its full geometric grid instead
+        """
+        first = next(iter(self.algorithms.values()))
+        if first.sampling == "adaptive":
+            return geometricSizes(first.maxSize, first.points)
+        return first.sizes()
+
+    def analyticalTime(self, n) -> float:
+        return sum(algorithm.analyticalTime(n) for algorithm in self.algorithms.values())
+
+    def expectedWork(self) -> float:
+        return sum(max(self.analyticalTime(size), 1) for size in self.sizes())
+
+    def measure(self, size: int, repeat: int = 0) -> List[Sample]:
+        """
+        Single work unit: one sample of every algorithm, all of them on copies of same input,
+        which is generated once
+        """
+        algorithms = list(self.algorithms.values())
+        array = algorithms[0].input(size, repeat) if algorithms else []
+        return [algorithm.measure(size, repeat, array) for algorithm in algorithms]
+
+    def iterRecords(self, isCancelled: Optional[Callable[[], bool]] = None
+                    ) -> Iterator[Tuple[int, Dict[str, Dict[str, float]]]]:
+        """
+        Measures every size "repeats" times with every algorithm
+        :param isCancelled: Checked between repeats, stops sweep when returns True
+        :return: Iterator of size with record of every algorithm
+        :raises AnalysisCancelled: When sweep was cancelled
+        """
+        isCancelled = isCancelled or (lambda: False)
+        sizes = self.sizes()
+        units = ((size, repeat) for size in sizes for repeat in range(self.repeats))
+        if self.workers > 1:
+            results = parallelUnits(self, units, self.workers)
+        else:
+            results = (self.measure(size, repeat) for size, repeat in units)
+
+        try:
+            for size in sizes:
+                sampleArrs = [[] for _ in self.algorithms]
+                for _ in range(self.repeats):
+                    if isCancelled():
+                        raise AnalysisCancelled()
+                    for sampleArr, sample in zip(sampleArrs, next(results)):
+                        sampleArr.append(sample)
+                yield size, {name: algorithm.aggregate(size, sampleArr)
+                             for (name, algorithm), sampleArr
+                             in zip(self.algorithms.items(), sampleArrs)}
+        finally:
+            results.close()
+
+    def iterCalculate(self, isCancelled: Optional[Callable[[], bool]] = None
+                      ) -> Iterator[Dict[str, float]]:
+        """
+        Streaming comparison, yields joined record of all algorithms as soon as size is measured
+        """
+        for size, records in self.iterRecords(isCancelled):
+            row = {"size": size}
+            for name, record in records.items():
+                row.update((self.columnKey(name, key), record[key])
+                           for key in self.columns if key in record)
+            yield row
+
+    def finalize(self, rows: Iterable[Dict[str, float]]) -> Measurements:
+        return Measurements.fromRows(rows).sortedBy("size")
+
+    def fitComplexity(self, data: Measurements) -> None:
+        """
+        Joined table has no single complexity to fit
+        """
+        return None
+
+    def calculate(self) -> Dict[str, Measurements]:
+        """
+        Measurements of every algorithm, each with its complexity fit
+        """
+        rows = {name: [] for name in self.algorithms}
+        for _, records in self.iterRecords():
+            for name, record in records.items():
+                rows[name].append(record)
+        return {name: algorithm.finalize(rows[name])
+                for name, algorithm in self.algorithms.items()}
+
+    def __repr__(self):
+        return "Porównanie algorytmów"
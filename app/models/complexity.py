@@ -0,0 +1,95 @@
+"""
+Empirical complexity classes fitted to measured times
+
+Every candidate model t(n) = constant + factor * g(n) is fitted by least squares at once,
+best fitting class is the one with highest coefficient of determination (R^2)
+"""
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+import numpy
+
+COMPLEXITIES: Dict[str, Callable[[numpy.ndarray], numpy.ndarray]] = {
+    "1": numpy.zeros_like,
+    "log n": numpy.log2,
+    "n": lambda n: n,
+    "n log n": lambda n: n * numpy.log2(n),
+    "n^2": lambda n: n ** 2,
+    "n^3": lambda n: n ** 3,
+}
+
+
+@dataclass(frozen=True)
+class Fit:
+    """
+    Model t(n) = constant + factor * g(n) of one complexity class
+    """
+    complexity: str
+    constant: float
+    factor: float
+    r2: float
+
+    def estimate(self, sizes: Sequence[int]) -> numpy.ndarray:
+        n = numpy.asarray(sizes, dtype=numpy.float64)
+        return self.constant + self.factor * COMPLEXITIES[self.complexity](n)
+
+    def __str__(self) -> str:
+        return f"O({self.complexity})"
+
+
+@dataclass(frozen=True)
+class ComplexityReport:
+    """
+    Fits of all candidate classes and the one declared by algorithm
+    """
+    declared: Fit
+    best: Fit
+    fits: Tuple[Fit, ...]
+
+    @property
+    def matches(self) -> bool:
+        return self.best.complexity == self.declared.complexity
+
+    def describe(self) -> str:
+        """
+        One line summary for status bar
+        """
+        if self.matches:
+            return f"złożoność empiryczna {self.best}, R² = {self.best.r2:.4f}"
+        return (f"UWAGA: złożoność empiryczna {self.best} (R² = {self.best.r2:.4f}) różni się "
+                f"od deklarowanej {self.declared} (R² = {self.declared.r2:.4f})")
+
+
+def fitComplexity(sizes: Sequence[int], times: Sequence[float],
+                  declared: str) -> Optional[ComplexityReport]:
+    """
+    Fits measured times to every candidate complexity class
+    :param sizes: Sizes of arrays
+    :param times: Measured time of every size
+    :param declared: Complexity class declared by algorithm, key of COMPLEXITIES
+    :return: Report, None when there are less than 3 sizes to fit
+    """
+    n = numpy.asarray(sizes, dtype=numpy.float64)
+    y = numpy.asarray(times, dtype=numpy.float64)
+    valid = (n >= 1) & numpy.isfinite(y)
+    n, y = n[valid], y[valid]
+    if len(n) < 3:
+        return None
+
+    names = tuple(COMPLEXITIES)
+    terms = numpy.stack([COMPLEXITIES[name](n) for name in names])
+    # Terms are scaled to [0, 1], so n^3 of large sizes doesn't make fit ill-conditioned
+    scale = terms.max(axis=1)
+    scale[scale == 0] = 1
+    design = numpy.stack((numpy.ones_like(terms), terms / scale[:, None]), axis=-1)
+    coefficients = numpy.linalg.pinv(design) @ y
+    residuals = y - numpy.einsum("mkp,mp->mk", design, coefficients)
+    total = numpy.sum((y - y.mean()) ** 2)
+    r2 = 1 - numpy.sum(residuals ** 2, axis=1) / total if total > 0 else numpy.ones(len(names))
+
+    fits = tuple(Fit(name, float(constant), float(factor / scale[m]), float(r2[m]))
+                 for m, (name, (constant, factor)) in enumerate(zip(names, coefficients)))
+    # Decreasing time is no complexity class, such fits are only used when nothing else is left
+    growing = [fit for fit in fits if fit.factor >= 0] or list(fits)
+    best = max(growing, key=lambda fit: fit.r2)
+    return ComplexityReport(fits[names.index(declared)], best, fits)
@@ -0,0 +1,288 @@
+"""
+Book corpora, record inputs of sweeps and previews
+
+synthetic  - seeded generator of any amount of books, with realistic distribution of title
+             lengths and titles sharing common prefixes (series, "Historia ...")
+file       - catalog in CSV or JSONL file (signature, title, author, publish_date columns),
+             streamed in chunks and sampled into at most MAX_RECORDS records
+
+Both have "array(size, repeat, repeats)" of InputGenerator, so sweep measures them the same
+way as integer arrays. Input depends only on seed, size and repetition, and only input which
+is asked for is generated
+"""
+import csv
+import functools
+import itertools
+import json
+import os
+from dataclasses import dataclass, field
+from datetime import date
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import numpy
+
+from .books import Book
+
+WORDS = (
+    "dom", "noc", "czas", "wojna", "miłość", "morze", "kraina", "cień", "sekret", "ogień",
+    "gwiazda", "ziemia", "miasto", "król", "królowa", "las", "rzeka", "zima", "lato", "dziecko",
+    "ojciec", "matka", "siostra", "brat", "przyjaciel", "wróg", "droga", "koniec", "początek",
+    "świat", "sen", "serce", "pamięć", "krew", "złoto", "kamień", "wiatr", "burza", "światło",
+    "ciemność", "północ", "południe", "wyspa", "góra", "ogród", "zamek", "wieża", "most", "słowo",
+    "księga", "list", "klucz", "lustro", "imię", "duch", "anioł", "smok", "wilk", "kruk", "róża",
+    "ostatni", "pierwszy", "długi", "cichy", "zimny", "stary", "nowy", "czarny", "biały",
+    "czerwony", "zielony", "wielki", "mały", "dziki", "obcy", "zaginiony", "ukryty", "wieczny",
+    "the", "of", "and", "night", "house", "time", "war", "love", "sea", "shadow", "secret",
+    "fire", "star", "city", "king", "queen", "river", "winter", "road", "world", "dream",
+    "heart", "blood", "gold", "stone", "wind", "storm", "light", "island", "garden", "tower",
+)
+PREFIXES = (
+    "Historia", "Kroniki", "Przygody", "Tajemnica", "Wielka księga", "Opowieści",
+    "Harry Potter i", "Wiedźmin:", "Pieśń lodu i ognia:", "Podręcznik", "Sztuka", "Życie",
+    "The History of", "The Lord of the", "A Guide to", "Introduction to",
+)
+FIRST_NAMES = (
+    "Anna", "Maria", "Katarzyna", "Małgorzata", "Agnieszka", "Olga", "Wisława", "Joanna",
+    "Piotr", "Jan", "Andrzej", "Krzysztof", "Stanisław", "Tomasz", "Jacek", "Szczepan",
+    "Margaret", "Delia", "Lucinda", "Stephen", "George", "Terry", "Ursula", "Neil",
+)
+LAST_NAMES = (
+    "Nowak", "Kowalska", "Wiśniewski", "Wójcik", "Kamińska", "Lewandowski", "Tokarczuk",
+    "Szymborska", "Sapkowski", "Lem", "Mickiewicz", "Sienkiewicz", "Prus", "Twardoch",
+    "Atwood", "Owens", "Riley", "King", "Martin", "Pratchett", "Le Guin", "Gaiman",
+)
+AUTHORS = tuple(f"{first} {last}" for first in FIRST_NAMES for last in LAST_NAMES)
+# Share of titles starting with one of common prefixes
+PREFIX_SHARE = 0.3
+# Titles have 1 + Poisson(mean) words, at most maxWords
+TITLE_WORDS_MEAN = 2.2
+TITLE_MAX_WORDS = 12
+FIRST_DATE = date(1950, 1, 1).toordinal()
+LAST_DATE = date(2024, 12, 31).toordinal()
+# Records of catalog file kept in memory, larger files are sampled while streamed
+MAX_RECORDS = 1000000
+
+
+def _zipfWeights(amount: int, exponent: float = 1.0) -> numpy.ndarray:
+    weights = 1 / numpy.arange(1, amount + 1) ** exponent
+    return weights / weights.sum()
+
+
+@dataclass(frozen=True)
+class SyntheticCorpus:
+    """
+    Seeded generator of book records
+
+    Words, prefixes and authors are drawn with Zipf weights, so some titles are common and
+    many titles share their beginning, which makes string comparisons realistic. Every
+    input has its own stream derived from (seed, size, repeat) and is generated by numpy
+    in chunks, so millions of records don't need huge temporary arrays
+    """
+    seed: Optional[int] = None
+    chunkSize: int = 100000
+    entropy: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        entropy = self.seed if self.seed is not None else numpy.random.SeedSequence().entropy
+        object.__setattr__(self, "entropy", entropy)
+
+    def parameters(self) -> Dict[str, Any]:
+        return {"corpus": "synthetic", "seed": self.seed}
+
+    def iterChunks(self, size: int, repeat: int = 0) -> Iterator[List[Book]]:
+        """
+        Generate records of one input chunk by chunk
+        :param size: Amount of records of input
+        :param repeat: Number of repetition
+        :return: Iterator of lists of at most chunkSize records, size in total
+        """
+        rng = numpy.random.default_rng([self.entropy, size, repeat])
+        wordTable = numpy.array(WORDS, dtype=object)
+        authorTable = numpy.array(AUTHORS, dtype=object)
+        wordWeights = _zipfWeights(len(WORDS))
+        prefixWeights = _zipfWeights(len(PREFIXES))
+        for first in range(0, size, self.chunkSize):
+            amount = min(self.chunkSize, size - first)
+            counts = numpy.minimum(1 + rng.poisson(TITLE_WORDS_MEAN, amount), TITLE_MAX_WORDS)
+            # Words of all titles in one flat list, title ends at cumulative sum of counts
+            words = wordTable[rng.choice(len(WORDS), size=int(counts.sum()), p=wordWeights)]
+            prefixes = numpy.where(rng.random(amount) < PREFIX_SHARE,
+                                   rng.choice(len(PREFIXES), size=amount, p=prefixWeights), -1)
+            authors = rng.integers(0, len(FIRST_NAMES), amount) * len(LAST_NAMES) + \
+                rng.choice(len(LAST_NAMES), size=amount, p=_zipfWeights(len(LAST_NAMES), 0.5))
+            # ISBN-13 with "978" prefix and valid check digit
+            digits = rng.integers(0, 10, size=(amount, 9))
+            digits = numpy.hstack((numpy.broadcast_to([9, 7, 8], (amount, 3)), digits))
+            check = (10 - (digits * numpy.tile([1, 3], 6)).sum(axis=1) % 10) % 10
+            signatures = digits @ 10 ** numpy.arange(12, 0, -1, dtype=numpy.int64) + check
+            # Newer books are more common
+            dates = FIRST_DATE + (rng.beta(3, 1, amount) * (LAST_DATE - FIRST_DATE)).astype(int)
+
+            chunk, start, words = [], 0, words.tolist()
+            for end, prefix, author, signature, ordinal in zip(
+                    numpy.cumsum(counts).tolist(), prefixes.tolist(), authorTable[authors].tolist(),
+                    signatures.astype(str).tolist(), dates.tolist()):
+                title = " ".join(words[start:end])
+                start = end
+                title = PREFIXES[prefix] + " " + title if prefix >= 0 else title.capitalize()
+                chunk.append(Book(signature=signature, title=title, author=author,
+                                  publish_date=date.fromordinal(ordinal)))
+            yield chunk
+
+    def array(self, size: int, repeat: int = 0, repeats: int = 1) -> List[Book]:
+        """
+        Single input, chunks of records joined into one list
+        :param size: Amount of records
+        :param repeat: Number of repetition
+        :param repeats: Amount of repetitions of size, input doesn't depend on it
+        :return: New list of records
+        """
+        return list(itertools.chain.from_iterable(self.iterChunks(size, repeat)))
+
+
+@dataclass(frozen=True)
+class FileCorpus:
+    """
+    Book catalog in CSV (with header) or JSONL file
+
+    File is streamed in chunks of chunkSize records. At most "limit" records are kept,
+    larger catalog is sampled uniformly while it's streamed (reservoir sampling), so memory
+    doesn't grow with file. Input of sweep is random selection of kept records (with
+    repetitions, when there are less records than size)
+    """
+    path: str
+    seed: Optional[int] = None
+    limit: int = MAX_RECORDS
+    chunkSize: int = 100000
+    entropy: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        entropy = self.seed if self.seed is not None else numpy.random.SeedSequence().entropy
+        object.__setattr__(self, "entropy", entropy)
+
+    def parameters(self) -> Dict[str, Any]:
+        # File changes are detected by its modification time and length. Missing file
+        # has neither, its error is raised once it's read
+        try:
+            stat = os.stat(self.path)
+            modified, length = stat.st_mtime_ns, stat.st_size
+        except OSError:
+            modified = length = None
+        return {"corpus": "file", "path": str(Path(self.path).resolve()),
+                "modified": modified, "bytes": length, "limit": self.limit, "seed": self.seed}
+
+    def iterChunks(self) -> Iterator[List[Book]]:
+        """
+        Read all records of file chunk by chunk
+        :return: Iterator of lists of at most chunkSize records
+        :raises ValueError: When file has unknown extension or invalid record
+        """
+        with open(self.path, newline="", encoding="utf-8") as file:
+            rows = self._iterRows(file)
+            while True:
+                chunk = [self._record(line, row)
+                         for line, row in itertools.islice(rows, self.chunkSize)]
+                if not chunk:
+                    return
+                yield chunk
+
+    def _iterRows(self, file) -> Iterator[tuple]:
+        suffix = Path(self.path).suffix.lower()
+        if suffix == ".csv":
+            reader = csv.DictReader(file)
+            for row in reader:
+                yield reader.line_num, row
+        elif suffix in (".jsonl", ".ndjson"):
+            for line, text in enumerate(file, 1):
+                if text.strip():
+                    try:
+                        yield line, json.loads(text)
+                    except json.JSONDecodeError as error:
+                        raise ValueError(f"{self.path}:{line}: {error}") from None
+        else:
+            raise ValueError(f"Unknown book catalog format '{suffix}', expected .csv or .jsonl")
+
+    def _record(self, line: int, row: Dict[str, Any]) -> Book:
+        title = row.get("title")
+        if not title:
+            raise ValueError(f"{self.path}:{line}: book has no title")
+        published = row.get("publish_date") or ""
+        try:
+            publishDate = date.fromisoformat(str(published)[:10]) if published else date.min
+        except ValueError:
+            raise ValueError(f"{self.path}:{line}: invalid publish date '{published}'") from None
+        return Book(signature=str(row.get("signature") or ""), title=str(title),
+                    author=str(row.get("author") or ""), publish_date=publishDate)
+
+    def sample(self) -> List[Book]:
+        """
+        Uniform sample of at most limit records of file, taken while it's streamed.
+        Sample doesn't depend on seed, records are picked by Algorithm R: record number i
+        replaces random kept record with probability limit / (i + 1)
+        """
+        rng = numpy.random.default_rng(0)
+        records: List[Book] = []
+        seen = 0
+        for chunk in self.iterChunks():
+            free = max(self.limit - len(records), 0)
+            records.extend(chunk[:free])
+            rest = chunk[free:]
+            if rest:
+                positions = rng.integers(0, numpy.arange(seen + free, seen + len(chunk)) + 1)
+                for record, position in zip(rest, positions.tolist()):
+                    if position < self.limit:
+                        records[position] = record
+            seen += len(chunk)
+        return records
+
+    def records(self) -> List[Book]:
+        """
+        Sample of records of file, cached per file version
+        """
+        stat = os.stat(self.path)
+        return _cachedFile(self.path, self.limit, self.chunkSize, stat.st_mtime_ns, stat.st_size)
+
+    def array(self, size: int, repeat: int = 0, repeats: int = 1) -> List[Book]:
+        """
+        Single input of size, random selection of records in random order
+        :param size: Amount of records
+        :param repeat: Number of repetition
+        :param repeats: Amount of repetitions of size, input doesn't depend on it
+        :return: New list of records
+        """
+        records = self.records()
+        rng = numpy.random.default_rng([self.entropy, size, repeat])
+        if size <= len(records):
+            indices = rng.choice(len(records), size=size, replace=False)
+        else:
+            indices = rng.integers(0, len(records), size)
+        return [records[index] for index in indices.tolist()]
+
+
+Corpus = Union[SyntheticCorpus, FileCorpus]
+
+
+def createCorpus(source: str, seed: Optional[int] = None) -> Optional[Corpus]:
+    """
+    Corpus by its source
+    :param source: "synthetic", path of catalog file or empty string for integer inputs
+    :param seed: Seed of generated or selected records
+    :return: Corpus, None for integer inputs
+    """
+    if not source:
+        return None
+    if source == "synthetic":
+        return SyntheticCorpus(seed)
+    return FileCorpus(source, seed)
+
+
+@functools.lru_cache(maxsize=1)
+def _cachedFile(path: str, limit: int, chunkSize: int, modified: int,
+                length: int) -> List[Book]:
+    # Seed only selects records of sample, so corpora of any seed share one read of file
+    corpus = FileCorpus(path, seed=0, limit=limit, chunkSize=chunkSize)
+    records = corpus.sample()
+    if not records:
+        raise ValueError(f"Book catalog '{path}' has no books")
+    return records
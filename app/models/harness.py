@@ -0,0 +1,115 @@
+import functools
+import gc
+import math
+import time
+import tracemalloc
+from dataclasses import dataclass
+from statistics import median
+from typing import Callable, List
+
+
+@functools.lru_cache(maxsize=None)
+def timerOverhead(samples: int = 10000) -> int:
+    """
+    Cost of empty timed region in this process, nanoseconds.
+    Median of many back-to-back perf_counter_ns() calls, calibrated once per process
+    """
+    clock = time.perf_counter_ns
+    deltas = []
+    for _ in range(samples):
+        start = clock()
+        deltas.append(clock() - start)
+    return int(median(deltas))
+
+
+@dataclass(frozen=True)
+class Harness:
+    """
+    Low overhead measurement of sort calls
+
+    Times with perf_counter_ns and subtracts calibrated timer overhead, keeps garbage
+    collector off inside timed region. Every input is first sorted once in its own timed
+    region, which is the sample whenever it lasts at least minRegion. Faster sorts are timed
+    again in batch: K copies of input sorted in one timed region, with K chosen so region
+    lasts about minRegion, and time is divided by K, so one sample isn't dominated by timer
+    resolution and overhead. Only batched regions are preceded by warm-up sorts, sorts long
+    enough to be timed alone don't pay for it
+
+    :param warmups: Warm-up sorts before batched timed region
+    :param disableGc: Switch garbage collector off during timed region
+    :param minRegion: Shortest timed region, seconds, well above timer overhead
+    :param maxBatch: Upper limit of copies sorted in one batch
+    """
+    warmups: int = 1
+    disableGc: bool = True
+    minRegion: float = 1e-5
+    maxBatch: int = 1000
+
+    def batchSize(self, period: float) -> int:
+        """
+        Amount of copies of input timed in one region, when one sort takes period seconds
+        """
+        if period >= self.minRegion:
+            return 1
+        return min(self.maxBatch, math.ceil(self.minRegion / max(period, 1e-9)))
+
+    def measure(self, sort: Callable[[list], None], array: list) -> float:
+        """
+        Times sort of copy of array, batch of copies when single sort is too short
+        :param sort: Sort function, mutates array
+        :param array: Input, left untouched
+        :return: Time per one sort in seconds
+        """
+        period = self._timed(sort, [list(array)])
+        batch = self.batchSize(period)
+        if batch == 1:
+            return period
+
+        for _ in range(self.warmups):
+            sort(list(array))
+        return self._timed(sort, [list(array) for _ in range(batch)])
+
+    def _timed(self, sort: Callable[[list], None], arrays: List[list]) -> float:
+        """
+        Times sort of every array in one region
+        :return: Time per one sort in seconds
+        """
+        clock = time.perf_counter_ns
+        gcEnabled = gc.isenabled()
+        if self.disableGc:
+            gc.disable()
+        try:
+            start = clock()
+            for array in arrays:
+                sort(array)
+            elapsed = clock() - start
+        finally:
+            if gcEnabled:
+                gc.enable()
+
+        return max(elapsed - timerOverhead(), 0) / len(arrays) / 1e9
+
+    def peakMemory(self, sort: Callable[[list], None], array: list) -> int:
+        """
+        Peak of memory allocated by sort over what was allocated before it, traced by
+        tracemalloc. Tracing slows sort down, so it must never be inside timed region
+        :param sort: Sort function, mutates array
+        :param array: Input, sorted in place
+        :return: Peak allocated bytes
+        """
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            # Peak can't be reset before Python 3.9, so only growth of it is visible
+            before, _ = tracemalloc.get_traced_memory()
+            sort(array)
+            _, peak = tracemalloc.get_traced_memory()
+            return max(peak - before, 0)
+
+        tracemalloc.start()
+        try:
+            before, _ = tracemalloc.get_traced_memory()
+            sort(array)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return max(peak - before, 0)
@@ -0,0 +1,273 @@
+"""
+Seeded integer inputs of sweeps and their distribution profiles
+
+random              - uniform random integers in bounds
+sorted              - ascending
+reversed            - descending
+nearly-sorted       - ascending with k random swaps of two elements (1% of size by default)
+few-unique          - drawn from only FEW_UNIQUE_VALUES distinct values
+organ-pipe          - ascending first half, descending second half
+sawtooth            - about sqrt(n) ascending runs, each spanning whole range of values
+median-of-3-killer  - McIlroy's adversarial order for QuickSort with median of first,
+                      middle and last element as pivot, quadratic without introsort.
+                      Order is replayed once per size in about O(n*log n) pure python,
+                      roughly 3 s for a million elements, then cached
+
+Every profile is arrangement of uniform random values, done by numpy for all repetitions
+of size at once
+"""
+import bisect
+import functools
+import math
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+import numpy
+
+PROFILES = ("random", "sorted", "reversed", "nearly-sorted", "few-unique", "organ-pipe",
+            "sawtooth", "median-of-3-killer")
+# Amount of distinct values of few-unique profile
+FEW_UNIQUE_VALUES = 10
+
+
+@dataclass(frozen=True)
+class InputGenerator:
+    """
+    Seeded generator of integer arrays in [lowerBound, upperBound)
+
+    All repetitions of one size are drawn by single numpy call into 2-D block.
+    Every size has its own stream derived from (seed, size), so block of size doesn't depend
+    on order of generation, process which generates it, or other sizes.
+    Without seed, random entropy is picked once per generator
+
+    :param profile: Distribution profile, one of PROFILES
+    :param swaps: Swaps of nearly-sorted profile, 1% of size when None
+    """
+    lowerBound: int
+    upperBound: int
+    seed: Optional[int] = None
+    profile: str = "random"
+    swaps: Optional[int] = None
+    entropy: int = field(init=False)
+
+    def __post_init__(self) -> None:
+        if self.profile not in PROFILES:
+            raise ValueError(f"Unknown input profile '{self.profile}'")
+        entropy = self.seed if self.seed is not None else numpy.random.SeedSequence().entropy
+        object.__setattr__(self, "entropy", entropy)
+
+    def block(self, size: int, repeats: int) -> numpy.ndarray:
+        """
+        Generate inputs for all repetitions of size
+        :param size: Size of array
+        :param repeats: Amount of arrays
+        :return: Array of shape (repeats, size)
+        """
+        rng = numpy.random.default_rng([self.entropy, size])
+        if self.profile == "few-unique":
+            values = rng.integers(self.lowerBound, self.upperBound, FEW_UNIQUE_VALUES,
+                                  dtype=numpy.int64)
+            return values[rng.integers(0, FEW_UNIQUE_VALUES, size=(repeats, size))]
+
+        block = rng.integers(self.lowerBound, self.upperBound, size=(repeats, size),
+                             dtype=numpy.int64)
+        if self.profile == "random":
+            return block
+        block.sort(axis=1)
+        if self.profile == "sorted":
+            return block
+        if self.profile == "reversed":
+            return block[:, ::-1]
+        if self.profile == "nearly-sorted":
+            return self._swap(block)
+        if self.profile == "organ-pipe":
+            return numpy.hstack((block[:, ::2], block[:, 1::2][:, ::-1]))
+        if self.profile == "sawtooth":
+            return block[:, _sawtoothOrder(size)]
+        return block[:, _medianOfThreeKillerOrder(size)]
+
+    def _swap(self, block: numpy.ndarray) -> numpy.ndarray:
+        """
+        Swaps k random pairs of elements in every row, one swap of all rows at once
+        """
+        repeats, size = block.shape
+        swaps = self.swaps if self.swaps is not None else max(size // 100, 1)
+        if size < 2:
+            return block
+        rows = numpy.arange(repeats)
+        # Own stream drawn row by row, so swaps of row don't depend on amount of rows
+        rng = numpy.random.default_rng([self.entropy, size, 1])
+        positions = rng.integers(0, size, size=(repeats, swaps, 2))
+        for swap in range(swaps):
+            first, second = positions[:, swap, 0], positions[:, swap, 1]
+            block[rows, first], block[rows, second] = block[rows, second], block[rows, first]
+        return block
+
+    def array(self, size: int, repeat: int = 0, repeats: int = 1) -> List[int]:
+        """
+        Single input converted into python list. Block of recently used size is cached,
+        so process which gets many repetitions of same size generates it only once
+        :param size: Size of array
+        :param repeat: Number of repetition, row of block
+        :param repeats: Amount of repetitions of size
+        :return: List of integers
+        """
+        return _cachedBlock(self, size, repeats)[repeat].tolist()
+
+
+@functools.lru_cache(maxsize=2)
+def _cachedBlock(generator: InputGenerator, size: int, repeats: int) -> numpy.ndarray:
+    return generator.block(size, repeats)
+
+
+@functools.lru_cache(maxsize=8)
+def _sawtoothOrder(size: int) -> numpy.ndarray:
+    """
+    Ranks of sorted values placed at every position of sawtooth: position p is element
+    p % length of tooth p // length, and ranks grow with element first, tooth second
+    """
+    teeth = max(math.isqrt(size), 1)
+    length = -(-size // teeth)
+    positions = numpy.arange(size)
+    keys = positions % length * teeth + positions // length
+    return numpy.argsort(numpy.argsort(keys))
+
+
+@functools.lru_cache(maxsize=8)
+def _medianOfThreeKillerOrder(size: int) -> numpy.ndarray:
+    """
+    Ranks of sorted values of adversarial order for QuickSort with median of three pivot
+    and no introsort depth limit, made by McIlroy's adversary (A Killer Adversary for
+    Quicksort, 1999). QuickSort sorts placeholders whose values are decided lazily during
+    comparisons: every compared pair of undecided ones fixes one of them as next smallest
+    value, preferring the one which isn't pivot candidate, so pivots are always among smallest
+    values.
+
+    Partitioning is replayed step by step like QuickSort.sort does it, but its scans jump
+    over runs of undecided placeholders, which are all greater than decided pivot. Only the
+    last of them matters to the adversary, as the next pivot candidate. Every level costs
+    O(log n) instead of O(n), so generation takes about O(n*log n) instead of O(n^2)
+    """
+    # QuickSort sorts inputs made here, import is deferred to avoid circular import
+    from .algorithms import QuickSort
+
+    gas = size
+    values = [gas] * size
+    state = {"solid": 0, "candidate": 0}
+    # Current position of every placeholder and sorted positions of decided ones
+    positions = list(range(size))
+    solid: List[int] = []
+
+    def freeze(index: int) -> None:
+        values[index] = state["solid"]
+        state["solid"] += 1
+        bisect.insort(solid, positions[index])
+
+    def compare(first: int, second: int) -> int:
+        if values[first] == gas and values[second] == gas:
+            freeze(first if first == state["candidate"] else second)
+        if values[first] == gas:
+            state["candidate"] = first
+        elif values[second] == gas:
+            state["candidate"] = second
+        return values[first] - values[second]
+
+    class Placeholder:
+        __slots__ = ("index",)
+
+        def __init__(self, index: int) -> None:
+            self.index = index
+
+        def __lt__(self, other):
+            return compare(self.index, other.index) < 0
+
+        def __gt__(self, other):
+            return compare(self.index, other.index) > 0
+
+        def __le__(self, other):
+            return compare(self.index, other.index) <= 0
+
+        def __ge__(self, other):
+            return compare(self.index, other.index) >= 0
+
+        def __eq__(self, other):
+            return compare(self.index, other.index) == 0
+
+    array = [Placeholder(index) for index in range(size)]
+
+    def swap(first: int, second: int) -> None:
+        firstIndex, secondIndex = array[first].index, array[second].index
+        array[first], array[second] = array[second], array[first]
+        positions[firstIndex], positions[secondIndex] = second, first
+        if (values[firstIndex] == gas) != (values[secondIndex] == gas):
+            old, new = (first, second) if values[firstIndex] != gas else (second, first)
+            del solid[bisect.bisect_left(solid, old)]
+            bisect.insort(solid, new)
+
+    def partition(start: int, end: int) -> Tuple[int, int]:
+        """
+        QuickSort._threeWayPartition of range [start, end] around decided pivot array[start]
+        """
+        pivot = array[start]
+        low, high = start, end + 1
+        lowEqual, highEqual = start, end + 1
+        while True:
+            low += 1
+            while array[low] < pivot and low != end:
+                low += 1
+            high -= 1
+            while True:
+                # Pivot is decided, so the nearest decided placeholder is in range
+                nearest = solid[bisect.bisect_right(solid, high) - 1]
+                if nearest < high:
+                    compare(pivot.index, array[nearest + 1].index)
+                    high = nearest
+                if not pivot < array[high]:
+                    break
+                high -= 1
+
+            if low == high and array[low] == pivot:
+                lowEqual += 1
+                swap(lowEqual, low)
+            if low >= high:
+                break
+
+            swap(low, high)
+            if array[low] == pivot:
+                lowEqual += 1
+                swap(lowEqual, low)
+            if array[high] == pivot:
+                highEqual -= 1
+                swap(highEqual, high)
+
+        low = high + 1
+        for index in range(start, lowEqual + 1):
+            swap(index, high)
+            high -= 1
+        for index in range(end, highEqual - 1, -1):
+            swap(index, low)
+            low += 1
+        return high + 1, low - 1
+
+    stack = [(0, size - 1)]
+    while stack:
+        start, end = stack.pop()
+        while end - start >= QuickSort.smallRange:
+            index = QuickSort._median(array, start, (start + end) // 2, end)
+            swap(start, index)
+            if values[array[start].index] == gas:
+                raise RuntimeError("Median of three pivot wasn't decided by adversary")
+            low, high = partition(start, end)
+            if low - start < end - high:
+                stack.append((high + 1, end))
+                end = low - 1
+            else:
+                stack.append((start, low - 1))
+                start = high + 1
+        else:
+            QuickSort._insertionSort(array, start, end)
+    # Placeholders never compared with other undecided ones get largest values
+    for index in range(size):
+        if values[index] == gas:
+            freeze(index)
+    return numpy.array(values, dtype=numpy.int64)
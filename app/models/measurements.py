@@ -0,0 +1,126 @@
+from collections.abc import Mapping
+from typing import Dict, Iterable, Iterator, Optional, Sequence
+
+import numpy
+
+
+class Measurements(Mapping):
+    """
+    Columnar result of algorithm analysis
+
+    Every column is kept as typed numpy array, so plot, table and exporters read numbers
+    directly. Values are turned into text only when a cell is displayed.
+    Behaves like read-only dict of columns: len() is amount of columns
+    """
+    dtypes = {
+        "size": numpy.int64,
+        "calculated_time": numpy.float64,
+        "estimated_time": numpy.float64,
+        "comparisons": numpy.float64,
+        "moves": numpy.float64,
+        "peak_memory": numpy.float64,
+        "repeats": numpy.int64,
+        "error": numpy.float64,
+    }
+    precision = {
+        "size": 0,
+        "calculated_time": 2,
+        "estimated_time": 2,
+        "comparisons": 2,
+        "moves": 2,
+        "peak_memory": 0,
+        "repeats": 0,
+        "error": 4,
+    }
+    # Columns recorded only in some modes, left out of empty measurements
+    optional = ("peak_memory",)
+
+    def __init__(self, columns: Optional[Dict[str, Sequence]] = None) -> None:
+        if columns is None:
+            columns = {key: () for key in self.dtypes if key not in self.optional}
+        self._columns = {
+            key: numpy.asarray(values, dtype=self.dtypes.get(key, numpy.float64))
+            for key, values in columns.items()
+        }
+
+    @classmethod
+    def fromRows(cls, rows: Iterable[Dict[str, float]]) -> "Measurements":
+        """
+        Builds measurements from records of numbers
+        :param rows: Iterable of dicts with same keys
+        :return: Measurements, with default columns when there are no rows
+        """
+        columns = None
+        for row in rows:
+            if columns is None:
+                columns = {key: [] for key in row}
+            for key, value in row.items():
+                columns[key].append(value)
+        return cls(columns)
+
+    def append(self, other: "Measurements") -> "Measurements":
+        """
+        Joins records of other measurements after these
+        :param other: Measurements with same columns, or any when these are empty
+        :return: New measurements
+        """
+        if not self.rows:
+            return other
+        return type(self)({
+            key: numpy.concatenate((values, other[key])) for key, values in self._columns.items()
+        })
+
+    def withColumn(self, key: str, values: Sequence) -> "Measurements":
+        """
+        Measurements with one column added or replaced
+        :param key: Column name
+        :param values: Value of every record
+        :return: New measurements
+        """
+        return type(self)({**self._columns, key: values})
+
+    def sortedBy(self, key: str) -> "Measurements":
+        """
+        Records ordered by column (stable)
+        :param key: Column name
+        :return: New measurements
+        """
+        order = numpy.argsort(self._columns[key], kind="stable")
+        return type(self)({name: values[order] for name, values in self._columns.items()})
+
+    def __getitem__(self, key: str) -> numpy.ndarray:
+        return self._columns[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def rows(self) -> int:
+        """
+        Amount of records in every column
+        """
+        return len(next(iter(self._columns.values()), ()))
+
+    def formatCell(self, row: int, key: str) -> str:
+        """
+        Formats single value for display
+        :param row: Index of record
+        :param key: Column name
+        :return: Formatted value
+        """
+        value = self._columns[key][row]
+        if numpy.isnan(value):
+            # Not known yet, e.g. estimated time before fitting
+            return "-"
+        # Joined tables name columns "<key> (<algorithm>)"
+        precision = self.precision.get(key.split(" (")[0], 2)
+        return f"{value:.{precision}f}"
+
+    def toDict(self) -> Dict[str, list]:
+        """
+        Converts columns into plain python lists, e.g. for serialization
+        """
+        return {key: values.tolist() for key, values in self._columns.items()}
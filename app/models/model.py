@@ -0,0 +1,376 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from .algorithms import ALGORITHMS, Algorithm
+from .cache import ResultCache
+from .comparison import Comparison
+from .complexity import ComplexityReport
+from .corpus import Corpus, createCorpus
+from .decorations import Decorations
+from .inputs import PROFILES
+from .measurements import Measurements
+from .samples import SampleStore
+
+
+class Model(QObject):
+    """
+    Main model for app
+    Inherits from QObject to implement PyQt signals/slots mechanism
+    """
+    repetitionsAmountChanged = pyqtSignal(int)
+    maxSizeChanged = pyqtSignal(int)
+    lowerBoundChanged = pyqtSignal(int)
+    upperBoundChanged = pyqtSignal(int)
+    algorithmChanged = pyqtSignal(str)
+    workersChanged = pyqtSignal(int)
+    samplingChanged = pyqtSignal(str)
+    samplingStepChanged = pyqtSignal(int)
+    samplingPointsChanged = pyqtSignal(int)
+    targetErrorChanged = pyqtSignal(float)
+    timeBudgetChanged = pyqtSignal(float)
+    memoryProfileChanged = pyqtSignal(bool)
+    decorateKeysChanged = pyqtSignal(bool)
+    corpusChanged = pyqtSignal(str)
+    profileChanged = pyqtSignal(str)
+    profileSwapsChanged = pyqtSignal(int)
+    comparedProfilesChanged = pyqtSignal(list)
+    comparedAlgorithmsChanged = pyqtSignal(list)
+
+    # Amount of configurations whose raw samples are kept for incremental sweeps
+    sampleStoresAmount = 8
+
+    def __init__(self):
+        super().__init__()
+
+        self._repetitionsAmount = 20
+        self._maxSize = 100
+        self._lowerBound = 1
+        self._upperBound = 1000
+        self._algorithm = "bucket-sort"
+        self._workers = 1
+        self._sampling = "linear"
+        self._samplingStep = 1
+        self._samplingPoints = 200
+        self._targetError = 0.0
+        self._timeBudget = 1.0
+        self._memoryProfile = False
+        self._decorateKeys = False
+        self._corpus = ""
+        self._profile = "random"
+        self._profileSwaps = 0
+        self._comparedProfiles = []
+        self._algorithmList = dict(ALGORITHMS)
+        self._comparedAlgorithms = list(self._algorithmList)
+        self.decorations = Decorations()
+        self.cache = ResultCache()
+        self._sampleStores = OrderedDict()
+
+    @property
+    def repetitionsAmount(self) -> int:
+        return self._repetitionsAmount
+
+    @repetitionsAmount.setter
+    def repetitionsAmount(self, value: int) -> None:
+        self._repetitionsAmount = value
+        self.repetitionsAmountChanged.emit(value)
+
+    @property
+    def maxSize(self) -> int:
+        return self._maxSize
+
+    @maxSize.setter
+    def maxSize(self, value: int) -> None:
+        self._maxSize = value
+        self.maxSizeChanged.emit(value)
+
+    @property
+    def lowerBound(self) -> int:
+        return self._lowerBound
+
+    @lowerBound.setter
+    def lowerBound(self, value):
+        self._lowerBound = value
+        self.lowerBoundChanged.emit(value)
+
+    @property
+    def upperBound(self) -> int:
+        return self._upperBound
+
+    @upperBound.setter
+    def upperBound(self, value: int) -> None:
+        self._upperBound = value
+        self.upperBoundChanged.emit(value)
+
+    @property
+    def algorithm(self) -> str:
+        return self._algorithm
+
+    @algorithm.setter
+    def algorithm(self, value: str) -> None:
+        self._algorithm = value
+        self.algorithmChanged.emit(value)
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @workers.setter
+    def workers(self, value: int) -> None:
+        self._workers = value
+        self.workersChanged.emit(value)
+
+    @property
+    def sampling(self) -> str:
+        return self._sampling
+
+    @sampling.setter
+    def sampling(self, value: str) -> None:
+        self._sampling = value
+        self.samplingChanged.emit(value)
+
+    @property
+    def samplingStep(self) -> int:
+        return self._samplingStep
+
+    @samplingStep.setter
+    def samplingStep(self, value: int) -> None:
+        self._samplingStep = value
+        self.samplingStepChanged.emit(value)
+
+    @property
+    def samplingPoints(self) -> int:
+        return self._samplingPoints
+
+    @samplingPoints.setter
+    def samplingPoints(self, value: int) -> None:
+        self._samplingPoints = value
+        self.samplingPointsChanged.emit(value)
+
+    @property
+    def targetError(self) -> float:
+        """
+        Target relative confidence interval of adaptive repetitions, 0 disables them
+        """
+        return self._targetError
+
+    @targetError.setter
+    def targetError(self, value: float) -> None:
+        self._targetError = value
+        self.targetErrorChanged.emit(value)
+
+    @property
+    def timeBudget(self) -> float:
+        return self._timeBudget
+
+    @timeBudget.setter
+    def timeBudget(self, value: float) -> None:
+        self._timeBudget = value
+        self.timeBudgetChanged.emit(value)
+
+    @property
+    def memoryProfile(self) -> bool:
+        return self._memoryProfile
+
+    @memoryProfile.setter
+    def memoryProfile(self, value: bool) -> None:
+        self._memoryProfile = value
+        self.memoryProfileChanged.emit(value)
+
+    @property
+    def decorateKeys(self) -> bool:
+        return self._decorateKeys
+
+    @decorateKeys.setter
+    def decorateKeys(self, value: bool) -> None:
+        self._decorateKeys = value
+        self.decorateKeysChanged.emit(value)
+
+    @property
+    def corpus(self) -> str:
+        """
+        Source of book records sorted by analysis: "synthetic", path of catalog file,
+        or empty string for integers
+        """
+        return self._corpus
+
+    @corpus.setter
+    def corpus(self, value: str) -> None:
+        self._corpus = value
+        self.corpusChanged.emit(value)
+
+    @property
+    def profile(self) -> str:
+        return self._profile
+
+    @profile.setter
+    def profile(self, value: str) -> None:
+        self._profile = value
+        self.profileChanged.emit(value)
+
+    @property
+    def profileSwaps(self) -> int:
+        """
+        Swaps of nearly-sorted profile, 0 for 1% of size
+        """
+        return self._profileSwaps
+
+    @profileSwaps.setter
+    def profileSwaps(self, value: int) -> None:
+        self._profileSwaps = value
+        self.profileSwapsChanged.emit(value)
+
+    @property
+    def comparedProfiles(self) -> List[str]:
+        """
+        Input profiles of comparison, current profile when empty
+        """
+        return self._comparedProfiles
+
+    @comparedProfiles.setter
+    def comparedProfiles(self, value: List[str]) -> None:
+        self._comparedProfiles = [profile for profile in PROFILES if profile in value]
+        self.comparedProfilesChanged.emit(self._comparedProfiles)
+
+    @property
+    def algorithmList(self) -> dict:
+        return self._algorithmList
+
+    @property
+    def comparedAlgorithms(self) -> List[str]:
+        return self._comparedAlgorithms
+
+    @comparedAlgorithms.setter
+    def comparedAlgorithms(self, value: List[str]) -> None:
+        # Keep order of algorithm list, so colors of curves don't depend on order of clicks
+        self._comparedAlgorithms = [name for name in self.algorithmList if name in value]
+        self.comparedAlgorithmsChanged.emit(self._comparedAlgorithms)
+
+    def initAlgorithm(self):
+        algorithm = self.algorithmList[self.algorithm](self.lowerBound, self.upperBound,
+                                                       self.maxSize, self.repetitionsAmount,
+                                                       workers=self.workers,
+                                                       sampling=self.sampling,
+                                                       step=self.samplingStep,
+                                                       points=self.samplingPoints,
+                                                       targetError=self.targetError or None,
+                                                       timeBudget=self.timeBudget,
+                                                       memoryProfile=self.memoryProfile,
+                                                       decorate=self.decorateKeys,
+                                                       corpus=self.initCorpus(),
+                                                       profile=self.profile,
+                                                       swaps=self.profileSwaps or None)
+        return algorithm
+
+    def initCorpus(self) -> Optional[Corpus]:
+        return createCorpus(self.corpus)
+
+    def initComparison(self) -> Comparison:
+        return Comparison.create(self.comparedAlgorithms, self.lowerBound, self.upperBound,
+                                 self.maxSize, self.repetitionsAmount, workers=self.workers,
+                                 sampling=self.sampling, step=self.samplingStep,
+                                 points=self.samplingPoints, memoryProfile=self.memoryProfile,
+                                 decorate=self.decorateKeys, corpus=self.initCorpus(),
+                                 profiles=self.comparedProfiles or [self.profile],
+                                 swaps=self.profileSwaps or None)
+
+    def cachedAnalysis(self) -> Optional[Tuple[Measurements, str]]:
+        """
+        Result of analysis with current parameters, if it was already calculated
+        """
+        algorithm = self.initAlgorithm()
+        data = self.cache.get(self.cache.key(algorithm))
+        if data is None:
+            return None
+
+        return data, algorithm.__repr__()
+
+    def clearCache(self) -> None:
+        """
+        Forgets results and raw samples of previous analyses, so they are measured again
+        """
+        self.cache.clear()
+        self._sampleStores.clear()
+
+    def complexityReport(self, data: Measurements) -> Optional[ComplexityReport]:
+        """
+        Complexity classes fitted to measurements of current algorithm
+        """
+        return self.initAlgorithm().fitComplexity(data)
+
+    def analyzeStream(self, isCancelled: Optional[Callable[[], bool]] = None
+                      ) -> Tuple[Iterator[Dict[str, float]], Algorithm]:
+        algorithm = self.initAlgorithm()
+
+        stream = algorithm.iterCalculate(isCancelled, self.sampleStore(algorithm))
+        return self._cacheStream(algorithm, stream), algorithm
+
+    def compareStream(self, isCancelled: Optional[Callable[[], bool]] = None
+                      ) -> Tuple[Iterator[Dict[str, float]], Comparison]:
+        """
+        Streamed comparison of compared algorithms over identical inputs. It isn't cached,
+        every comparison draws new random inputs
+        """
+        comparison = self.initComparison()
+        return comparison.iterCalculate(isCancelled), comparison
+
+    def comparisonKey(self) -> tuple:
+        """
+        Parameters which define result of comparison
+        """
+        return (tuple(self.comparedAlgorithms), tuple(self.comparedProfiles),
+                *self.analysisKey()[1:])
+
+    def sampleStore(self, algorithm: Algorithm) -> SampleStore:
+        """
+        Raw samples of previous sweeps which differ from this one only by maxSize or
+        amount of repetitions, so growing sweep costs only new sizes and repetitions
+        """
+        key = self.cache.key(algorithm, exclude=("maxSize", "repeats"))
+        store = self._sampleStores.pop(key, None) or SampleStore()
+        self._sampleStores[key] = store
+        while len(self._sampleStores) > self.sampleStoresAmount:
+            self._sampleStores.popitem(last=False)
+        return store
+
+    def _cacheStream(self, algorithm: Algorithm, stream: Iterator[Dict[str, float]]
+                     ) -> Iterator[Dict[str, float]]:
+        """
+        Passes records through and caches result once stream is completed
+        """
+        rows = []
+        for row in stream:
+            rows.append(row)
+            yield row
+        self.cache.put(self.cache.key(algorithm), algorithm.finalize(rows))
+
+    def analysisKey(self) -> tuple:
+        """
+        Parameters which define result of analysis, identical keys mean identical jobs
+        """
+        return (self.algorithm, self.lowerBound, self.upperBound, self.maxSize,
+                self.repetitionsAmount, self.workers, self.sampling, self.samplingStep,
+                self.samplingPoints, self.targetError, self.timeBudget, self.memoryProfile,
+                self.decorateKeys, self.corpus, self.profile, self.profileSwaps)
+
+    def reset(self) -> None:
+        self._repetitionsAmount = 20
+        self._maxSize = 100
+        self._lowerBound = 1
+        self._upperBound = 1000
+        self._algorithm = "bucket-sort"
+        self._workers = 1
+        self._sampling = "linear"
+        self._samplingStep = 1
+        self._samplingPoints = 200
+        self._targetError = 0.0
+        self._timeBudget = 1.0
+        self._memoryProfile = False
+        self._decorateKeys = False
+        self._corpus = ""
+        self._profile = "random"
+        self._profileSwaps = 0
+        self._comparedProfiles = []
+        self._comparedAlgorithms = list(self._algorithmList)
+        self.decorations.reset()
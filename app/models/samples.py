@@ -0,0 +1,51 @@
+import threading
+from typing import Dict, List, NamedTuple
+
+
+class Sample(NamedTuple):
+    """
+    Measurements of one work unit: one sort (or one batch of tiny sorts) of given size
+    """
+    period: float
+    comparisons: float
+    moves: float
+    peakMemory: float = 0.0
+
+
+class SampleStore:
+    """
+    Raw per-size samples of sweeps with same configuration
+
+    Sweep takes samples it already has from store and measures only missing sizes
+    and repetitions, then extends store with them. Thread safe
+    """
+
+    def __init__(self) -> None:
+        self._samples: Dict[int, List[Sample]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, size: int, repeats: int) -> List[Sample]:
+        """
+        Known samples of size
+        :param size: Size of array
+        :param repeats: Maximum amount of samples to return
+        :return: Copy of samples, first ones measured
+        """
+        with self._lock:
+            return list(self._samples.get(size, ())[:repeats])
+
+    def extend(self, size: int, start: int, samples: List[Sample]) -> None:
+        """
+        Adds samples of repetitions from start on. Ignored when store already has other
+        samples for those repetitions, e.g. measured by concurrent sweep
+        :param size: Size of array
+        :param start: Number of first repetition
+        :param samples: New samples
+        """
+        with self._lock:
+            known = self._samples.setdefault(size, [])
+            if len(known) == start:
+                known.extend(samples)
+
+    def __len__(self) -> int:
+        return len(self._samples)
@@ -0,0 +1,69 @@
+"""
+Strategies choosing sizes of arrays measured by sweep
+
+linear     - every step-th size from 1 to maxSize
+geometric  - log-spaced sizes, same amount of points per decade
+adaptive   - coarse geometric grid, refined where measured curve bends or is noisy
+"""
+from typing import List
+
+import numpy
+
+SAMPLINGS = ("linear", "geometric", "adaptive")
+
+
+def linearSizes(maxSize: int, step: int = 1) -> List[int]:
+    return list(range(1, maxSize, max(step, 1)))
+
+
+def geometricSizes(maxSize: int, points: int) -> List[int]:
+    """
+    Log-spaced sizes from 1 to maxSize (exclusive). Small sizes collapse into
+    consecutive integers, so amount of sizes may be lower than points
+    """
+    if maxSize <= 1:
+        return []
+    sizes = numpy.geomspace(1, maxSize - 1, num=max(points, 2))
+    return numpy.unique(numpy.rint(sizes).astype(numpy.int64)).tolist()
+
+
+def refineSizes(sizes: List[int], periods: List[float], deviations: List[float],
+                amount: int) -> List[int]:
+    """
+    Picks new sizes between measured ones for adaptive sampling.
+    Every gap between neighbouring sizes is scored by bend of log-log curve at its ends
+    (change of local slope beyond noise) plus relative standard deviation of its ends,
+    weighted by logarithmic width of gap. New sizes are geometric middles of best scored gaps
+    :param sizes: Measured sizes
+    :param periods: Mean time of every size
+    :param deviations: Standard deviation of time of every size
+    :param amount: Maximum amount of new sizes
+    :return: Sorted new sizes, empty when nothing is left to refine
+    """
+    order = numpy.argsort(sizes)
+    size = numpy.asarray(sizes, dtype=numpy.float64)[order]
+    period = numpy.maximum(numpy.asarray(periods, dtype=numpy.float64)[order], 1e-12)
+    deviation = numpy.asarray(deviations, dtype=numpy.float64)[order]
+    if len(size) < 2 or amount < 1:
+        return []
+
+    x, y = numpy.log(size), numpy.log(period)
+    noise = deviation / period
+    slope = numpy.diff(y) / numpy.diff(x)
+    # Change of slope which can't be explained by noise of close neighbours
+    slopeNoise = (noise[:-1] + noise[1:]) / numpy.diff(x)
+    bend = numpy.zeros(len(size))
+    bend[1:-1] = numpy.maximum(numpy.abs(numpy.diff(slope)) - slopeNoise[:-1] - slopeNoise[1:],
+                               0)
+    score = (numpy.maximum(bend[:-1], bend[1:]) + numpy.maximum(noise[:-1], noise[1:])) * \
+        numpy.diff(x)
+
+    # Gaps without integer size inside can't be refined
+    middle = numpy.rint(numpy.sqrt(size[:-1] * size[1:]))
+    middle = numpy.clip(middle, size[:-1] + 1, size[1:] - 1)
+    refinable = numpy.diff(size) > 1
+    score, middle = score[refinable], middle[refinable]
+
+    # Refine at most quarter of gaps per round, so new measurements steer next rounds
+    best = numpy.argsort(score)[::-1][:min(amount, max(1, len(score) // 4))]
+    return numpy.unique(middle[best].astype(numpy.int64)).tolist()
@@ -1,5 +1,5 @@
 from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtWidgets import QAction, QColorDialog, QMainWindow
+from PyQt5.QtWidgets import QAction, QColorDialog, QFileDialog, QInputDialog, QMainWindow
 
 from app.models import Model
 from app.views.ui import UiMainWindow
@@ -23,7 +23,14 @@ class View(QMainWindow):
         self.ui.maxSizeInput.setText(str(self._model.maxSize))
         self.ui.lowerBoundInput.setText(str(self._model.lowerBound))
         self.ui.upperBoundInput.setText(str(self._model.upperBound))
+        self.ui.workersInput.setText(str(self._model.workers))
         self.ui.algorithmSelect.setCurrentIndex(0)
+        self._model.memoryProfileChanged.emit(self._model.memoryProfile)
+        self._model.decorateKeysChanged.emit(self._model.decorateKeys)
+        self._model.corpusChanged.emit(self._model.corpus)
+        self._model.profileChanged.emit(self._model.profile)
+        self._model.comparedProfilesChanged.emit(self._model.comparedProfiles)
+        self._model.comparedAlgorithmsChanged.emit(self._model.comparedAlgorithms)
         self.ui.statusbar.showMessage("Status: Wyczyszczone")
 
     @pyqtSlot()
@@ -58,6 +65,200 @@ class View(QMainWindow):
         self._model.decorations.lineWidth = int(width)
         self.ui.statusbar.showMessage(f"Info: Grubość linii została zmeniona na {width}")
 
+    @pyqtSlot(str)
+    def setSampling(self, sampling):
+        self._model.sampling = sampling
+        self.ui.statusbar.showMessage(f"Info: Próbkowanie rozmiarów zostało zmienione na "
+                                      f"{sampling}")
+
+    @pyqtSlot()
+    def setSamplingStep(self):
+        step, ok = QInputDialog.getInt(self, "Krok próbkowania", "Krok próbkowania liniowego",
+                                       self._model.samplingStep, 1)
+        if ok:
+            self._model.samplingStep = step
+            self.ui.statusbar.showMessage(f"Info: Krok próbkowania został zmieniony na {step}")
+
+    @pyqtSlot()
+    def setSamplingPoints(self):
+        points, ok = QInputDialog.getInt(self, "Liczba punktów",
+                                         "Liczba punktów pomiarowych (geometryczne, adaptacyjne)",
+                                         self._model.samplingPoints, 2)
+        if ok:
+            self._model.samplingPoints = points
+            self.ui.statusbar.showMessage(
+                f"Info: Liczba punktów pomiarowych została zmieniona na {points}")
+
+    @pyqtSlot()
+    def setTargetError(self):
+        error, ok = QInputDialog.getDouble(
+            self, "Powtórzenia adaptacyjne",
+            "Docelowy względny przedział ufności średniej, % (0 - stała liczba powtórzeń)",
+            self._model.targetError * 100, 0, 100, 2)
+        if ok:
+            self._model.targetError = error / 100
+            self.ui.statusbar.showMessage(
+                f"Info: Docelowy przedział ufności został zmieniony na {error:.2f}%")
+
+    @pyqtSlot()
+    def setTimeBudget(self):
+        budget, ok = QInputDialog.getDouble(self, "Budżet czasu",
+                                            "Budżet czasu na jeden rozmiar, s",
+                                            self._model.timeBudget, 0.01, 3600, 2)
+        if ok:
+            self._model.timeBudget = budget
+            self.ui.statusbar.showMessage(
+                f"Info: Budżet czasu na rozmiar został zmieniony na {budget:.2f} s")
+
+    @pyqtSlot(bool)
+    def setMemoryProfile(self, enabled):
+        self._model.memoryProfile = enabled
+        state = "włączone" if enabled else "wyłączone"
+        self.ui.statusbar.showMessage(f"Info: Profilowanie pamięci zostało {state}")
+
+    def memoryProfileAction(self):
+        action = QAction(' &Profilowanie pamięci (tracemalloc)', self)
+        action.setCheckable(True)
+        action.setChecked(self._model.memoryProfile)
+        action.toggled.connect(self.setMemoryProfile)
+        self._model.memoryProfileChanged.connect(action.setChecked)
+        return action
+
+    @pyqtSlot(bool)
+    def setDecorateKeys(self, enabled):
+        self._model.decorateKeys = enabled
+        state = "włączone" if enabled else "wyłączone"
+        self.ui.statusbar.showMessage(f"Info: Sortowanie kluczy rekordów zostało {state}")
+
+    def decorateKeysAction(self):
+        action = QAction(' &Sortowanie kluczy rekordów (dekoracja)', self)
+        action.setCheckable(True)
+        action.setChecked(self._model.decorateKeys)
+        action.toggled.connect(self.setDecorateKeys)
+        self._model.decorateKeysChanged.connect(action.setChecked)
+        return action
+
+    @pyqtSlot(str)
+    def setCorpus(self, corpus):
+        self._model.corpus = corpus
+        sources = {"": "liczby całkowite", "synthetic": "książki syntetyczne"}
+        self.ui.statusbar.showMessage(
+            f"Info: Dane wejściowe zostały zmienione na {sources.get(corpus, corpus)}")
+
+    @pyqtSlot()
+    def setCorpusFile(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Katalog książek", "",
+                                              "Katalogi książek (*.csv *.jsonl *.ndjson)")
+        if path:
+            self.setCorpus(path)
+        else:
+            # Dialog was cancelled, checked state of actions is restored
+            self._model.corpusChanged.emit(self._model.corpus)
+
+    def corpusAction(self, corpus, label):
+        action = QAction(f' &{label}', self)
+        action.setCheckable(True)
+        action.setChecked(self._model.corpus == corpus)
+        action.triggered.connect(lambda: self.setCorpus(corpus))
+        self._model.corpusChanged.connect(lambda value: action.setChecked(value == corpus))
+        return action
+
+    def corpusFileAction(self):
+        action = QAction(' &Katalog książek z pliku...', self)
+        action.setCheckable(True)
+        action.setChecked(self._model.corpus not in ("", "synthetic"))
+        action.triggered.connect(self.setCorpusFile)
+        self._model.corpusChanged.connect(
+            lambda value: action.setChecked(value not in ("", "synthetic")))
+        return action
+
+    @pyqtSlot(str)
+    def setProfile(self, profile):
+        self._model.profile = profile
+        self.ui.statusbar.showMessage(f"Info: Profil danych wejściowych został zmieniony na "
+                                      f"{profile}")
+
+    def profileAction(self, profile, label):
+        action = QAction(f' &{label}', self)
+        action.setCheckable(True)
+        action.setChecked(self._model.profile == profile)
+        action.triggered.connect(lambda: self.setProfile(profile))
+        self._model.profileChanged.connect(lambda value: action.setChecked(value == profile))
+        return action
+
+    @pyqtSlot()
+    def setProfileSwaps(self):
+        swaps, ok = QInputDialog.getInt(self, "Liczba zamian",
+                                        "Liczba zamian profilu prawie posortowanego "
+                                        "(0 - 1% rozmiaru)",
+                                        self._model.profileSwaps, 0)
+        if ok:
+            self._model.profileSwaps = swaps
+            self.ui.statusbar.showMessage(f"Info: Liczba zamian została zmieniona na {swaps}")
+
+    def profileSwapsAction(self):
+        action = QAction(' &Liczba zamian (prawie posortowane)', self)
+        action.triggered.connect(self.setProfileSwaps)
+        return action
+
+    @pyqtSlot(str, bool)
+    def setComparedProfile(self, profile, compared):
+        profiles = [other for other in self._model.comparedProfiles if other != profile]
+        self._model.comparedProfiles = profiles + [profile] if compared else profiles
+        self.ui.statusbar.showMessage(
+            f"Info: Porównywane profile: "
+            f"{', '.join(self._model.comparedProfiles) or self._model.profile}")
+
+    def comparedProfileAction(self, profile, label):
+        action = QAction(f' &{label}', self)
+        action.setCheckable(True)
+        action.setChecked(profile in self._model.comparedProfiles)
+        action.toggled.connect(lambda compared: self.setComparedProfile(profile, compared))
+        self._model.comparedProfilesChanged.connect(
+            lambda profiles: action.setChecked(profile in profiles))
+        return action
+
+    @pyqtSlot(str, bool)
+    def setCompared(self, name, compared):
+        names = [other for other in self._model.comparedAlgorithms if other != name]
+        self._model.comparedAlgorithms = names + [name] if compared else names
+        self.ui.statusbar.showMessage(
+            f"Info: Porównywane algorytmy: {', '.join(self._model.comparedAlgorithms) or 'brak'}")
+
+    def comparedAlgorithmAction(self, name, label):
+        action = QAction(f' &{label}', self)
+        action.setCheckable(True)
+        action.setChecked(name in self._model.comparedAlgorithms)
+        action.toggled.connect(lambda compared: self.setCompared(name, compared))
+        self._model.comparedAlgorithmsChanged.connect(
+            lambda names: action.setChecked(name in names))
+        return action
+
+    def targetErrorAction(self):
+        action = QAction(' &Docelowy przedział ufności', self)
+        action.triggered.connect(self.setTargetError)
+        return action
+
+    def timeBudgetAction(self):
+        action = QAction(' &Budżet czasu na rozmiar', self)
+        action.triggered.connect(self.setTimeBudget)
+        return action
+
+    def samplingAction(self, sampling, label):
+        action = QAction(f' &{label}', self)
+        action.triggered.connect(lambda: self.setSampling(sampling))
+        return action
+
+    def samplingStepAction(self):
+        action = QAction(' &Krok próbkowania liniowego', self)
+        action.triggered.connect(self.setSamplingStep)
+        return action
+
+    def samplingPointsAction(self):
+        action = QAction(' &Liczba punktów pomiarowych', self)
+        action.triggered.connect(self.setSamplingPoints)
+        return action
+
     def colorLineAction(self):
         action = QAction(' &Kolor linii', self)
         action.triggered.connect(self.setLineColor)
@@ -97,3 +298,13 @@ class View(QMainWindow):
         action = QAction(' &Resetuj', self)
         action.triggered.connect(self.reset)
         return action
+
+    @pyqtSlot()
+    def clearCache(self):
+        self._model.clearCache()
+        self.ui.statusbar.showMessage("Info: Zapisane wyniki analiz zostały usunięte")
+
+    def clearCacheAction(self):
+        action = QAction(' &Wyczyść zapisane wyniki', self)
+        action.triggered.connect(self.clearCache)
+        return action
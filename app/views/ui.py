@@ -2,18 +2,50 @@ from typing import TYPE_CHECKING
 
 import numpy
 import pyqtgraph
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
 from PyQt5.QtGui import QFont, QIntValidator
 from PyQt5.QtWidgets import (QComboBox, QHBoxLayout, QHeaderView, QLabel, QLineEdit,
                              QPushButton,
                              QSplitter,
-                             QStatusBar, QTableWidget, QTableWidgetItem, QVBoxLayout,
+                             QStatusBar, QTableView, QVBoxLayout,
                              QWidget)
 from pyqtgraph import mkPen
 
+from app.models.comparison import Comparison
+from app.models.measurements import Measurements
+
 if TYPE_CHECKING:
     from app.views import View
 
+# Curve colors of compared algorithms, in order of algorithm list
+COMPARISON_COLORS = ("#000000", "#FF0000", "#00AA00", "#0000FF", "#FF9900", "#AA00AA", "#00AAAA",
+                     "#996633", "#888888", "#FF66CC", "#66CC00", "#003399", "#CC3300",
+                     "#009966", "#6633FF", "#CCAA00", "#660000", "#3399FF")
+# Curve styles of compared input profiles, in order of profile list
+PROFILE_STYLES = (Qt.SolidLine, Qt.DashLine, Qt.DotLine, Qt.DashDotLine, Qt.DashDotDotLine)
+
+# Labels of input profiles in menus
+PROFILE_LABELS = {
+    "random": "Losowe",
+    "sorted": "Posortowane",
+    "reversed": "Posortowane odwrotnie",
+    "nearly-sorted": "Prawie posortowane",
+    "few-unique": "Mało unikalnych wartości",
+    "organ-pipe": "Piszczałka organowa",
+    "sawtooth": "Piłokształtne",
+    "median-of-3-killer": "Zabójca mediany z trzech",
+}
+
+# Plotted columns of single algorithm: legend name, color and style, where None follows
+# line color and style of decorations
+ALGORITHM_SERIES = {
+    "calculated_time": ("Koszt czasowy (pomiar), us", None, None),
+    "estimated_time": ("Koszt czasowy (model dopasowany), us", "#FF0000", Qt.SolidLine),
+    "comparisons": ("Liczba porównań", "#00FF00", Qt.SolidLine),
+    "moves": ("Liczba przestawień", "#FF9900", Qt.SolidLine),
+    "peak_memory": ("Pamięć szczytowa (tracemalloc), B", "#0000FF", Qt.DashLine),
+}
+
 
 class UiMainWindow:
     def __init__(self, MainWindow: "View"):
@@ -61,15 +93,34 @@ class UiMainWindow:
         self.upperBoundInput = StyledInput(str(self._window._model.upperBound))
         self.upperBoundInput.setValidator(QIntValidator())
 
+        # Workers amount
+        self.workersLabel = StyledLabel("Liczba procesów obliczeniowych")
+        self.workersInput = StyledInput(str(self._window._model.workers))
+        self.workersInput.setValidator(QIntValidator())
+
         # Algorithm combobox
         self.algorithmSelectLabel = StyledLabel("Wybierz algorytmu do analizy")
         self.algorithmSelect = StyledSelect()
         # Select items
         self.algorithmSelect.addItem("Bucket sort", "bucket-sort")
+        self.algorithmSelect.addItem("Bucket sort (256 kubełków)", "bucket-sort-256")
+        self.algorithmSelect.addItem("Bucket sort (quick sort w kubełkach)", "bucket-sort-quick")
+        self.algorithmSelect.addItem("Bucket sort (jednopoziomowy)", "bucket-sort-single-level")
         self.algorithmSelect.addItem("Bubble sort", "bubble-sort")
+        self.algorithmSelect.addItem("Counting sort", "counting-sort")
+        self.algorithmSelect.addItem("Heap sort", "heap-sort")
         self.algorithmSelect.addItem("Insertion sort", "insertion-sort")
+        self.algorithmSelect.addItem("Merge sort", "merge-sort")
+        self.algorithmSelect.addItem("Merge sort (wstępujący)", "merge-sort-bottom-up")
         self.algorithmSelect.addItem("Quick sort", "quick-sort")
+        self.algorithmSelect.addItem("Quick sort (pierwszy pivot)", "quick-sort-first")
+        self.algorithmSelect.addItem("Quick sort (losowy pivot)", "quick-sort-random")
+        self.algorithmSelect.addItem("Quick sort (ninther)", "quick-sort-ninther")
+        self.algorithmSelect.addItem("Radix sort (8 bitów)", "radix-sort")
+        self.algorithmSelect.addItem("Radix sort (11 bitów)", "radix-sort-11")
+        self.algorithmSelect.addItem("Radix sort (NumPy)", "radix-sort-numpy")
         self.algorithmSelect.addItem("Selection sort", "selection-sort")
+        self.algorithmSelect.addItem("Timsort (wbudowany)", "timsort")
 
         # Splitter
         self.splitter = QSplitter()
@@ -89,6 +140,9 @@ class UiMainWindow:
         self.presentationLabel.setAlignment(Qt.AlignCenter)
         self.tablePresentationButton = StyledButton("Tabelaryczna prezentacja złożoności")
         self.plotPresentationButton = StyledButton("Graficzna prezentacja złożoności")
+        self.compareTableButton = StyledButton("Tabelaryczne porównanie algorytmów")
+        self.comparePlotButton = StyledButton("Graficzne porównanie algorytmów")
+        self.cancelButton = StyledButton("Zatrzymaj obliczenie")
 
         # Add widgets to management layout
         self.managementLayout.addWidget(self.settingsLabel)
@@ -100,6 +154,8 @@ class UiMainWindow:
         self.managementLayout.addWidget(self.lowerBoundInput)
         self.managementLayout.addWidget(self.upperBoundLabel)
         self.managementLayout.addWidget(self.upperBoundInput)
+        self.managementLayout.addWidget(self.workersLabel)
+        self.managementLayout.addWidget(self.workersInput)
         self.managementLayout.addWidget(self.algorithmSelectLabel)
         self.managementLayout.addWidget(self.algorithmSelect)
         self.managementLayout.addWidget(self.visualizationLabel)
@@ -110,6 +166,9 @@ class UiMainWindow:
         self.managementLayout.addWidget(self.presentationLabel)
         self.managementLayout.addWidget(self.tablePresentationButton)
         self.managementLayout.addWidget(self.plotPresentationButton)
+        self.managementLayout.addWidget(self.compareTableButton)
+        self.managementLayout.addWidget(self.comparePlotButton)
+        self.managementLayout.addWidget(self.cancelButton)
 
         # Add widgets to main layout
         self.mainLayout.addLayout(self.presentationLayout, 5)
@@ -135,9 +194,55 @@ class UiMainWindow:
         for i in range(1, 11):
             self.lineWidthMenu.addAction(self._window.lineWidthAction(i))
 
+        # Analysis menu
+        self.analysisMenu = self.menubar.addMenu('&Analiza')
+
+        # Sampling submenu
+        self.samplingMenu = self.analysisMenu.addMenu('&Próbkowanie rozmiarów')
+        self.samplingMenu.addAction(self._window.samplingAction("linear", "Liniowe"))
+        self.samplingMenu.addAction(self._window.samplingAction("geometric", "Geometryczne"))
+        self.samplingMenu.addAction(self._window.samplingAction("adaptive", "Adaptacyjne"))
+        self.samplingMenu.addSeparator()
+        self.samplingMenu.addAction(self._window.samplingStepAction())
+        self.samplingMenu.addAction(self._window.samplingPointsAction())
+
+        # Adaptive repetitions submenu
+        self.repetitionsMenu = self.analysisMenu.addMenu('&Powtórzenia adaptacyjne')
+        self.repetitionsMenu.addAction(self._window.targetErrorAction())
+        self.repetitionsMenu.addAction(self._window.timeBudgetAction())
+
+        self.analysisMenu.addAction(self._window.memoryProfileAction())
+        self.analysisMenu.addAction(self._window.decorateKeysAction())
+
+        # Input data submenu
+        self.corpusMenu = self.analysisMenu.addMenu('&Dane wejściowe')
+        self.corpusMenu.addAction(self._window.corpusAction("", "Liczby całkowite"))
+        self.corpusMenu.addAction(self._window.corpusAction("synthetic", "Książki syntetyczne"))
+        self.corpusMenu.addAction(self._window.corpusFileAction())
+
+        # Input profile submenu
+        self.profileMenu = self.analysisMenu.addMenu('&Profil danych wejściowych')
+        for profile, label in PROFILE_LABELS.items():
+            self.profileMenu.addAction(self._window.profileAction(profile, label))
+        self.profileMenu.addSeparator()
+        self.profileMenu.addAction(self._window.profileSwapsAction())
+
+        # Compared algorithms submenu
+        self.comparedMenu = self.analysisMenu.addMenu('&Porównywane algorytmy')
+        for n in range(self.algorithmSelect.count()):
+            self.comparedMenu.addAction(self._window.comparedAlgorithmAction(
+                self.algorithmSelect.itemData(n), self.algorithmSelect.itemText(n)))
+
+        # Compared profiles submenu
+        self.comparedProfilesMenu = self.analysisMenu.addMenu('&Porównywane profile')
+        for profile, label in PROFILE_LABELS.items():
+            self.comparedProfilesMenu.addAction(
+                self._window.comparedProfileAction(profile, label))
+
         # Reset menu
         self.resetMenu = self.menubar.addMenu('&Resetuj')
         self.resetMenu.addAction(self._window.resetAction())
+        self.resetMenu.addAction(self._window.clearCacheAction())
 
         # Statusbar
         self.statusbar = QStatusBar(self._window)
@@ -147,77 +252,174 @@ class UiMainWindow:
         self.statusbar.setFixedHeight(35)
         self._window.setStatusBar(self.statusbar)
 
-    def createTable(self, data, rows, columns):
+    def createTable(self, data):
         """
         Creates table presentation
         """
-        self.presentationLayout.removeWidget(self.plot)
-        self.presentationLayout.removeWidget(self.table)
-        self.table = TableView(data, rows, columns)
-        self.presentationLayout.addWidget(self.table)
+        if self.table is None:
+            self.table = TableView(data)
+            self.presentationLayout.addWidget(self.table)
+        else:
+            self.table.updateTable(data)
+        self.showPresentation(self.table)
+
+    def plotView(self):
+        """
+        Plot is created once and reused by every run
+        """
+        if self.plot is None:
+            self.plot = PlotView()
+            self.presentationLayout.addWidget(self.plot)
+        return self.plot
+
+    def showPresentation(self, widget):
+        for presentation in (self.plot, self.table):
+            if presentation is not None and presentation is not widget:
+                presentation.hide()
+        widget.show()
 
     def createPlot(self, data, title, lineColor="#000000", backgroundColor="#ffffff", lineWidth=3,
                    lineStyle=Qt.SolidLine):
         """
         Creates plot presentation
         """
-        self.presentationLayout.removeWidget(self.plot)
-        self.presentationLayout.removeWidget(self.table)
-        self.plot = pyqtgraph.PlotWidget()
-
-        # Plot customizations
-        self.plot.setTitle(title, size="20pt")
-        self.plot.setLabel('left', "Pomiary")
-        self.plot.setLabel('bottom', "Rozmiar")
-        self.plot.setBackground(backgroundColor)
-        self.plot.showGrid(x=True, y=True)
-        self.plot.addLegend()
-        self.presentationLayout.addWidget(self.plot)
-
-        # Evaluate string to float type
-        self.size = numpy.array(data["size"]).astype(numpy.float)
-        self.calculatedTime = numpy.array(data["calculated_time"]).astype(numpy.float)
-        self.estimatedTime = numpy.array(data["estimated_time"]).astype(numpy.float)
-        self.memory = numpy.array(data["memory"]).astype(numpy.float)
-
-        # Creates 3 graph for
-        # X: Calculated time, Y: Size
-        calcTimePen = mkPen(color=lineColor, width=lineWidth, style=lineStyle)
-        self.plot.plot(self.size, self.calculatedTime, name="Koszt czasowy (pomiar), us",
-                       pen=calcTimePen)
-
-        # X: Estimated time, Y: Size
-        estimTimePen = mkPen(color="#FF0000", width=lineWidth, style=Qt.SolidLine)
-        self.plot.plot(self.size, self.estimatedTime, name="Koszt czasowy (wzór), O(n)",
-                       pen=estimTimePen)
-
-        # X: Memory, Y: Size
-        memoryPen = pyqtgraph.mkPen(color="#00FF00", width=lineWidth, style=Qt.SolidLine)
-        self.plot.plot(self.size, self.memory, name="Koszt pamięci, O(n)", pen=memoryPen)
+        plot = self.plotView()
+        plot.setDecorations(lineColor, backgroundColor, lineWidth, lineStyle)
+        plot.showData(data, title, ALGORITHM_SERIES)
+        self.showPresentation(plot)
 
-    def updatePlots(self, lineColor="#000000", backgroundColor="#ffffff", lineWidth=3,
-                    lineStyle=Qt.SolidLine):
-        if self.plot:
-            self.plot.setBackground(backgroundColor)
+    def createComparisonPlot(self, data, algorithms, title, lineColor="#000000",
+                             backgroundColor="#ffffff", lineWidth=3, lineStyle=Qt.SolidLine):
+        """
+        Creates plot with time (and peak memory) curves of every compared algorithm overlaid.
+        Algorithms keep their own colors, only width and background follow decorations.
+        When algorithms are compared on several input profiles, every profile has its own
+        line style and memory curves are left out, they would share styles with profiles
+        """
+        classes = list(dict.fromkeys(type(algorithm) for algorithm in algorithms.values()))
+        profiles = list(dict.fromkeys(algorithm.profile for algorithm in algorithms.values()))
+        series = {}
+        for name, algorithm in algorithms.items():
+            color = COMPARISON_COLORS[classes.index(type(algorithm)) % len(COMPARISON_COLORS)]
+            style = PROFILE_STYLES[profiles.index(algorithm.profile) % len(PROFILE_STYLES)]
+            series[Comparison.columnKey(name, "calculated_time")] = \
+                (f"{name}: czas, us", color, style)
+            if len(profiles) == 1:
+                series[Comparison.columnKey(name, "peak_memory")] = \
+                    (f"{name}: pamięć szczytowa, B", color, Qt.DashLine)
+        plot = self.plotView()
+        plot.setDecorations(lineColor, backgroundColor, lineWidth, lineStyle)
+        plot.showData(data, title, series)
+        self.showPresentation(plot)
+
+    def appendPlot(self, data):
+        """
+        Appends streamed records to existing plot curves
+        """
+        if self.plot is not None and self.plot.isVisible():
+            self.plot.appendData(data)
 
-            calcTimePen = mkPen(color=lineColor, width=lineWidth, style=lineStyle)
-            self.plot.plot(self.size, self.calculatedTime, name="Koszt czasowy (pomiar), us",
-                           pen=calcTimePen, clear=True)
+    def updateEstimate(self, data):
+        """
+        Replaces estimated time with one fitted to completed sweep
+        """
+        if self.plot is not None and self.plot.isVisible():
+            self.plot.replaceData(data)
+        if self.table is not None and self.table.isVisible():
+            self.table.updateColumn(data, "estimated_time")
 
-            estimTimePen = mkPen(color="#FF0000", width=lineWidth, style=Qt.SolidLine)
-            self.plot.plot(self.size, self.estimatedTime, name="Koszt czasowy (wzór), O(n)",
-                           pen=estimTimePen)
+    def appendTable(self, data):
+        """
+        Appends streamed records to existing table
+        """
+        if self.table is not None and self.table.isVisible():
+            self.table.appendData(data)
 
-            memoryPen = mkPen(color="#00FF00", width=lineWidth, style=Qt.SolidLine)
-            self.plot.plot(self.size, self.memory, name="Koszt pamięci, O(n)", pen=memoryPen)
+    def updatePlots(self, lineColor="#000000", backgroundColor="#ffffff", lineWidth=3,
+                    lineStyle=Qt.SolidLine):
+        if self.plot is not None:
+            self.plot.setDecorations(lineColor, backgroundColor, lineWidth, lineStyle)
 
     def resetPresentation(self):
-        if self.plot is not None and self.plot.plotItem is not None:
-            self.plot.close()
+        if self.plot is not None:
+            self.plot.showData(Measurements(), "", {})
+            self.plot.hide()
         if self.table is not None:
-            self.table.close()
-        self.presentationLayout.removeWidget(self.plot)
-        self.presentationLayout.removeWidget(self.table)
+            self.table.updateTable(Measurements())
+            self.table.hide()
+
+
+class PlotView(pyqtgraph.PlotWidget):
+    """
+    Persistent plot of measurement columns against size
+
+    Curve of every column is created once and reused: new data is passed with setData,
+    decorations only change pens, so restyling never re-uploads data. Large series are
+    clipped to view and downsampled (peak mode keeps spikes visible)
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.setLabel('left', "Pomiary")
+        self.setLabel('bottom', "Rozmiar")
+        self.showGrid(x=True, y=True)
+        self.addLegend()
+        self.setClipToView(True)
+        self.setDownsampling(auto=True, mode="peak")
+
+        self.data = Measurements()
+        # Column -> (legend name, color, style), None color and style follow decorations
+        self.series = {}
+        self.curves = {}
+        self.lineColor, self.lineWidth, self.lineStyle = "#000000", 3, Qt.SolidLine
+
+    def showData(self, data, title, series):
+        """
+        Replaces data, title and set of plotted columns
+        """
+        self.setTitle(title, size="20pt")
+        for key in list(self.curves):
+            if series.get(key) != self.series.get(key):
+                self.removeItem(self.curves.pop(key))
+        self.series = series
+        self.replaceData(data)
+
+    def appendData(self, data):
+        self.data = self.data.append(data)
+        if numpy.any(numpy.diff(self.data["size"]) < 0):
+            # Adaptive sampling delivers sizes out of order
+            self.data = self.data.sortedBy("size")
+        self.refresh()
+
+    def replaceData(self, data):
+        self.data = data
+        self.refresh()
+
+    def refresh(self):
+        """
+        Sets data of curves, curves of columns which appeared in data are created
+        """
+        for key, (name, color, style) in self.series.items():
+            if key not in self.data:
+                if key in self.curves:
+                    self.removeItem(self.curves.pop(key))
+                continue
+            curve = self.curves.get(key)
+            if curve is None:
+                curve = self.curves[key] = self.plot(name=name, pen=self.pen(color, style),
+                                                     connect="finite")
+            curve.setData(self.data["size"], self.data[key])
+
+    def setDecorations(self, lineColor, backgroundColor, lineWidth, lineStyle):
+        self.setBackground(backgroundColor)
+        self.lineColor, self.lineWidth, self.lineStyle = lineColor, lineWidth, lineStyle
+        for key, curve in self.curves.items():
+            _, color, style = self.series[key]
+            curve.setPen(self.pen(color, style))
+
+    def pen(self, color, style):
+        return mkPen(color=color or self.lineColor, width=self.lineWidth,
+                     style=self.lineStyle if style is None else style)
 
 
 class StyledLabel(QLabel):
@@ -257,11 +459,107 @@ class StyledSelect(QComboBox):
         )
 
 
-class TableView(QTableWidget):
+class ColumnsTableModel(QAbstractTableModel):
+    """
+    Table model over columnar data: Measurements or mapping of column name to sequence
+
+    Cells are formatted only when view asks for them, so memory used by table doesn't
+    depend on amount of rows
+    """
+
+    def __init__(self, data=None, parent=None):
+        super().__init__(parent)
+        self._data = data if data is not None else {}
+        self._keys = list(self._data.keys())
+        self._rows = self.countRows(self._data)
+
+    @staticmethod
+    def countRows(data):
+        if isinstance(data, Measurements):
+            return data.rows
+        return len(next(iter(data.values()), ()))
+
+    @property
+    def columns(self):
+        return self._data
+
+    def setColumns(self, data):
+        """
+        Replaces whole data. Data of same shape only refreshes cells, so view keeps its
+        scroll position
+        """
+        if list(data.keys()) == self._keys and self.countRows(data) == self._rows:
+            self._data = data
+            if self._rows:
+                self.dataChanged.emit(self.index(0, 0),
+                                      self.index(self._rows - 1, len(self._keys) - 1))
+            return
+        self.beginResetModel()
+        self._data = data
+        self._keys = list(data.keys())
+        self._rows = self.countRows(data)
+        self.endResetModel()
+
+    def appendRows(self, data):
+        """
+        Adds streamed measurements, or chunk of columns of same keys, below existing rows
+        """
+        if isinstance(self._data, Measurements):
+            joined = self._data.append(data)
+            if list(joined.keys()) != self._keys or numpy.any(numpy.diff(joined["size"]) < 0):
+                # Other columns, or sizes delivered out of order by adaptive sampling
+                self.setColumns(joined.sortedBy("size"))
+                return
+        else:
+            if list(data.keys()) != self._keys and self._rows:
+                self.setColumns(data)
+                return
+            joined = {key: [*self._data.get(key, ()), *values] for key, values in data.items()}
+            if list(joined.keys()) != self._keys:
+                self.setColumns(joined)
+                return
+
+        rows = self.countRows(joined)
+        if rows == self._rows:
+            return
+        self.beginInsertRows(QModelIndex(), self._rows, rows - 1)
+        self._data, self._rows = joined, rows
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._keys)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            key = self._keys[index.column()]
+            if isinstance(self._data, Measurements):
+                return self._data.formatCell(index.row(), key)
+            return str(self._data[key][index.row()])
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._keys[section]
+        return str(section + 1)
+
+
+class TableView(QTableView):
+    """
+    Table presentation, created once and reused by every run
+    """
+
     def __init__(self, data, *args):
-        QTableWidget.__init__(self, *args)
-        self.data = data
-        self.setData()
+        super().__init__(*args)
+        self.setModel(ColumnsTableModel(data, self))
         self.setMinimumHeight(300)
         self.setMinimumWidth(400)
         self.setStyleSheet("background-color: #ffffff; color: #000000")
@@ -269,16 +567,22 @@ class TableView(QTableWidget):
         header.setStyleSheet("font-size: 14px;")
         header.setSectionResizeMode(QHeaderView.Stretch)
 
+    @property
+    def data(self):
+        return self.model().columns
+
     def updateTable(self, data):
-        self.data = data
-        self.setData()
-
-    def setData(self):
-        horHeaders = []
-        for n, key in enumerate(self.data.keys()):
-            horHeaders.append(key)
-            for m, item in enumerate(self.data[key]):
-                newItem = QTableWidgetItem(item)
-                newItem.setTextAlignment(Qt.AlignCenter)
-                self.setItem(m, n, newItem)
-        self.setHorizontalHeaderLabels(horHeaders)
+        self.model().setColumns(data)
+
+    def appendData(self, data):
+        """
+        Adds rows of streamed measurements below existing ones
+        """
+        self.model().appendRows(data)
+
+    def updateColumn(self, data, key):
+        """
+        Replaces data by one of same records, e.g. with fitted column
+        """
+        if key in data and ColumnsTableModel.countRows(data) == self.model().rowCount():
+            self.model().setColumns(data)
@@ -1,7 +1,9 @@
 import sys
+from multiprocessing import freeze_support
 
-from app import App
+from app.application import App
 
 if __name__ == '__main__':
+    freeze_support()
     app = App(sys.argv)
     sys.exit(app.exec_())